@@ -6,15 +6,29 @@ This module provides the foundation for collecting player projections from "
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Union
 from datetime import datetime, date
 import asyncio
+import json
+import sys
 from dataclasses import dataclass
 from enum import Enum
 import logging
 
+json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    # orjson decodes API payloads considerably faster when it is installed
+    from orjson import loads as _orjson_loads
+except ImportError:  # pragma: no cover - optional speedup
+    json_loads = json.loads
+else:
+    json_loads = _orjson_loads
+
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) is only available on Python 3.10+
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class SportType(Enum):
     """Supported sports for DFS."""
@@ -74,10 +88,19 @@ class DataCollectionConfig:
     rate_limit_delay: float = 1.0  # seconds between requests
     max_retries: int = 3
     timeout: int = 30
+    max_connections: int = 20  # pooled connections shared by the session
+    max_connections_per_host: int = 8
     user_agent: Optional[str] = None
     headers: Optional[Dict[str, str]] = None
 
 
+def _is_json_content_type(content_type: str) -> bool:
+    """Whether a response content type is JSON (application/json or +json)."""
+    return content_type == "application/json" or (
+        content_type.startswith("application/") and content_type.endswith("+json")
+    )
+
+
 class DataCollectionError(Exception):
     """Custom exception for data collection errors."""
 
@@ -135,10 +158,33 @@ class BaseDataCollector(ABC):
             self.logger.error(f"Connection validation failed: {e}")
             return False
 
+    def _ensure_session(self) -> Any:
+        """Return the shared HTTP session, creating it on first use.
+
+        The session owns a keep-alive connection pool so repeated requests to
+        the same host reuse TLS connections and cached DNS lookups.
+        """
+        if self.session is None:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                limit_per_host=self.config.max_connections_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+                headers=self.config.headers or {},
+            )
+        return self.session
+
     async def cleanup(self) -> None:
         """Clean up resources (close sessions, etc.)."""
         if self.session:
             await self.session.close()
+            self.session = None
 
     def __enter__(self) -> "BaseDataCollector":
         """Context manager entry."""
@@ -169,25 +215,25 @@ class BaseAPICollector(BaseDataCollector):
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Make an HTTP request to the API."""
-        if not self.session:
-            import aiohttp
-
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-                headers=self.config.headers or {},
-            )
-
+        session = self._ensure_session()
         url = f"{self.config.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
 
         for attempt in range(self.config.max_retries):
             try:
-                if self.session is None:
-                    raise DataCollectionError("Session not initialized")
-                async with self.session.get(
+                async with session.get(
                     url, params=params, headers=headers
                 ) as response:
                     if response.status == 200:
-                        result = await response.json()
+                        # Same guard as aiohttp's response.json(), which
+                        # decoding the raw body would otherwise skip
+                        if not _is_json_content_type(response.content_type):
+                            raise DataCollectionError(
+                                "Attempt to decode JSON with unexpected "
+                                f"mimetype: {response.content_type}"
+                            )
+                        # An empty body decodes to None, as response.json() did
+                        body = await response.read()
+                        result = json_loads(body) if body.strip() else None
                         if isinstance(result, dict):
                             return result
                         else:
@@ -221,15 +267,7 @@ class BaseWebScrapingCollector(BaseDataCollector):
 
     async def _get_page_content(self, url: str) -> str:
         """Get HTML content from a webpage."""
-        if not self.session:
-            import aiohttp
-
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-                headers=self.config.headers or {},
-            )
-
-        async with self.session.get(url) as response:
+        async with self._ensure_session().get(url) as response:
             response.raise_for_status()
             return await response.text()
 
@@ -25,6 +25,9 @@ from ..base import (
     DataCollectionError,
 )
 
+# Dates shown on the lineup tools pages, e.g. 10/16/2025 or 10/16/25
+_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{2,4})")
+
 
 class DailyFantasyFuelCollector(BaseWebScrapingCollector):
     """Collects DFS projections by scraping Daily Fantasy Fuel website."""
@@ -216,10 +219,7 @@ class DailyFantasyFuelCollector(BaseWebScrapingCollector):
             await asyncio.sleep(self.config.rate_limit_delay)
 
             # Download the CSV content
-            if self.session is None:
-                raise DataCollectionError("Session not initialized")
-
-            async with self.session.get(csv_url) as response:
+            async with self._ensure_session().get(csv_url) as response:
                 response.raise_for_status()
                 content = await response.text()
 
@@ -379,19 +379,19 @@ class DailyFantasyFuelCollector(BaseWebScrapingCollector):
             html_content = await self._get_page_content(full_url)
             soup = await self._parse_html(html_content)
 
-            # Look for date information on the page
+            # Look for date information on the page in a single pass
             dates = []
-
-            # Look for date elements
-            for date_elem in soup.find_all(text=re.compile(r"\d{1,2}/\d{1,2}/\d{2,4}")):
+            page_text = soup.get_text(" ")
+
+            for month, day, year in _DATE_RE.findall(page_text):
+                # Build the date from the captured groups; two-digit years
+                # are taken to be in the 2000s
+                year_value = int(year)
+                if year_value < 100:
+                    year_value += 2000
                 try:
-                    # Extract date from text
-                    date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{2,4})", date_elem)
-                    if date_match:
-                        date_str = date_match.group(1)
-                        parsed_date = datetime.strptime(date_str, "%m/%d/%Y").date()
-                        dates.append(parsed_date)
-                except Exception:
+                    dates.append(date(year_value, int(month), int(day)))
+                except ValueError:
                     continue
 
             # If no dates found, return today
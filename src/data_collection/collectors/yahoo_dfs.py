@@ -9,13 +9,18 @@ This collector uses the Yahoo DFS API to extract contest details including:
 """
 
 import asyncio
-import json
-from typing import List, Optional, Dict, Any
+import time
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping, Tuple
 from datetime import date, datetime
 from dataclasses import dataclass
 import re
 
 from ..base import (
+    DATACLASS_SLOTS,
     BaseAPICollector,
     DataCollectionConfig,
     DataSourceType,
@@ -24,7 +29,7 @@ from ..base import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class YahooContest:
     """Data structure for Yahoo DFS contest information."""
 
@@ -38,6 +43,8 @@ class YahooContest:
     max_entries_per_user: int
     slate_type: str = "UNKNOWN"
     salary_cap: int = 0
+    contest_type: str = "Standard"
+    guaranteed: bool = False
     source: str = "Yahoo DFS"
     last_updated: Optional[datetime] = None
 
@@ -53,6 +60,81 @@ class YahooContest:
             raise ValueError("Max entries per user must be positive")
 
 
+# Seconds a cached contest list (and its contests' ID lookups) stays valid
+CONTEST_CACHE_TTL = 60.0
+
+# Yahoo DFS sport codes (read-only; shared by every collector instance)
+_SPORT_CODES: Mapping[SportType, str] = MappingProxyType(
+    {
+        SportType.NFL: "nfl",
+        SportType.NBA: "nba",
+        SportType.MLB: "mlb",
+        SportType.NHL: "nhl",
+    }
+)
+_SPORT_BY_CODE: Mapping[str, SportType] = MappingProxyType(
+    {code: sport for sport, code in _SPORT_CODES.items()}
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Defaults for contest fields the API may omit, and a single extractor for them
+_CONTEST_DEFAULTS: Dict[str, Any] = {
+    "id": "",
+    "title": "",
+    "paidEntryFee": {},
+    "paidTotalPrize": {},
+    "entryLimit": 0,
+    "multipleEntryLimit": 1,
+    "startTime": "",
+    "slateType": "UNKNOWN",
+    "salaryCap": 0,
+    "sportCode": "nfl",
+    "guaranteed": False,
+}
+_extract_contest_fields = itemgetter(*_CONTEST_DEFAULTS)
+
+# Contest name keywords checked (in priority order) before the API type field
+_CONTEST_NAME_KEYWORDS: Tuple[Tuple[str, str], ...] = (
+    ("guaranteed", "Guaranteed"),
+    ("qualifier", "Qualifier"),
+    ("satellite", "Satellite"),
+)
+# Display labels for API contest types that don't title-case cleanly
+_CONTEST_TYPE_LABELS: Mapping[str, str] = MappingProxyType(
+    {"50-50": "50/50", "head2head": "Head-to-Head", "league": "League"}
+)
+
+
+@lru_cache(maxsize=4096)
+def _standardize_player_name(name: str) -> str:
+    """Standardize player name to Yahoo format (cached per distinct name)."""
+    if not name:
+        return ""
+    return _WHITESPACE_RE.sub(" ", name.strip()).lower()
+
+
+@lru_cache(maxsize=256)
+def _epoch_seconds_to_date(seconds: int) -> date:
+    """Convert epoch seconds to a local calendar date (cached per slate time)."""
+    return date.fromtimestamp(seconds)
+
+
+def _coerce_csv_value(value: Optional[str]) -> Any:
+    """Convert a CSV cell to int or float when numeric, or None when blank."""
+    if not value:
+        return None
+    stripped = value.strip()
+    if not stripped:
+        return None
+    digits = stripped[1:] if stripped[:1] in ("-", "+") else stripped
+    if digits.isdecimal():
+        return int(stripped)
+    if "." in digits and digits.replace(".", "", 1).isdecimal():
+        return float(stripped)
+    return stripped
+
+
 class YahooDFSCollector(BaseAPICollector):
     """Collects contest information from Yahoo DFS using their API."""
 
@@ -70,13 +152,14 @@ class YahooDFSCollector(BaseAPICollector):
         )
         super().__init__(config)
 
-        # Yahoo DFS sport codes
-        self.sport_codes = {
-            SportType.NFL: "nfl",
-            SportType.NBA: "nba", 
-            SportType.MLB: "mlb",
-            SportType.NHL: "nhl",
-        }
+        # Recent collect_contests() results keyed by (sport, multi_entry_only)
+        self._contest_cache: Dict[
+            Tuple[SportType, bool], Tuple[float, List[YahooContest]]
+        ] = {}
+        # Contest ID -> (fetch time, contest) over all cached contest lists
+        self._contest_by_id: Dict[str, Tuple[float, YahooContest]] = {}
+        # Statistics for the cached contest lists, dropped when a list is refreshed
+        self._contest_stats: Dict[Tuple[SportType, bool], Dict[str, Any]] = {}
 
     async def collect_contests(
         self, 
@@ -103,7 +186,7 @@ class YahooDFSCollector(BaseAPICollector):
             )
 
             # Get the sport code
-            sport_code = self.sport_codes.get(sport)
+            sport_code = _SPORT_CODES.get(sport)
             if not sport_code:
                 raise DataCollectionError(f"Unsupported sport: {sport.value}")
 
@@ -115,27 +198,16 @@ class YahooDFSCollector(BaseAPICollector):
             if not response:
                 raise DataCollectionError("No response from Yahoo DFS API")
 
-            # Parse the response
-            contests = self._parse_api_response(response)
-            self.logger.info(f"Found {len(contests)} total contests")
-
-            # Filter by contest types if specified
-            if contest_types:
-                contests = [
-                    contest
-                    for contest in contests
-                    if any(
-                        ct.lower() in contest.contest_type.lower()
-                        for ct in contest_types
-                    )
-                ]
+            # One timestamp for the whole batch so every contest shares it
+            now = datetime.now()
 
-            # Filter for multi-entry contests only if requested
-            if multi_entry_only:
-                contests = [
-                    contest for contest in contests 
-                    if contest.max_entries_per_user > 1
-                ]
+            # Parse the response, applying the filters as contests are parsed
+            contests = self._parse_api_response(
+                response,
+                now,
+                contest_types=contest_types,
+                multi_entry_only=multi_entry_only,
+            )
 
             self.logger.info(
                 f"Returning {len(contests)} contests "
@@ -147,61 +219,172 @@ class YahooDFSCollector(BaseAPICollector):
         except Exception as e:
             raise DataCollectionError(f"Failed to collect contests from Yahoo DFS: {e}")
 
-    def _parse_api_response(self, response: Dict[str, Any]) -> List[YahooContest]:
-        """Parse the API response to extract contest information."""
+    async def collect_contests_cached(
+        self,
+        sport: SportType,
+        multi_entry_only: bool = True,
+        ttl: float = CONTEST_CACHE_TTL,
+    ) -> List[YahooContest]:
+        """
+        Collect contests, reusing a recent result for the same query.
+
+        Args:
+            sport: The sport to collect contests for
+            multi_entry_only: Whether to only return multi-entry contests
+            ttl: Seconds a cached result stays valid
+
+        Returns:
+            List of YahooContest objects
+        """
+        key = (sport, multi_entry_only)
+        now = time.monotonic()
+        cached = self._contest_cache.get(key)
+        # Callers get their own list, so sorting or filtering it in place
+        # can't change what later callers see
+        if cached and now - cached[0] < ttl:
+            return list(cached[1])
+
+        contests = await self.collect_contests(sport, multi_entry_only=multi_entry_only)
+        self._contest_cache[key] = (now, list(contests))
+        # Rebuild the ID index so contests gone from the fresh list drop out
+        self._contest_by_id = {
+            contest.contest_id: (fetched_at, contest)
+            for fetched_at, cached_contests in self._contest_cache.values()
+            for contest in cached_contests
+        }
+        self._contest_stats.pop(key, None)
+        return contests
+
+    async def warm_contest_cache(
+        self, sport: SportType, multi_entry_only: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Fetch contests and precompute their statistics ahead of first use.
+
+        Args:
+            sport: The sport to collect contests for
+            multi_entry_only: Whether to only return multi-entry contests
+
+        Returns:
+            Contest statistics for the freshly cached contests
+        """
+        await self.collect_contests_cached(sport, multi_entry_only, ttl=0.0)
+        return await self.get_cached_contest_statistics(sport, multi_entry_only)
+
+    async def get_cached_contest_statistics(
+        self,
+        sport: SportType,
+        multi_entry_only: bool = True,
+        ttl: float = CONTEST_CACHE_TTL,
+    ) -> Dict[str, Any]:
+        """
+        Get statistics for the cached contests, computing them once per refresh.
+
+        Args:
+            sport: The sport to collect contests for
+            multi_entry_only: Whether to only return multi-entry contests
+            ttl: Seconds a cached contest list stays valid
+
+        Returns:
+            Contest statistics as returned by get_contest_statistics()
+        """
+        contests = await self.collect_contests_cached(sport, multi_entry_only, ttl)
+        key = (sport, multi_entry_only)
+        stats = self._contest_stats.get(key)
+        if stats is None:
+            stats = self._contest_stats[key] = self.get_contest_statistics(contests)
+        return stats
+
+    def _parse_api_response(
+        self,
+        response: Dict[str, Any],
+        now: Optional[datetime] = None,
+        contest_types: Optional[List[str]] = None,
+        multi_entry_only: bool = False,
+    ) -> List[YahooContest]:
+        """
+        Parse the API response to extract contest information.
+
+        Args:
+            response: Decoded API response
+            now: Timestamp to record as each contest's last update
+            contest_types: Only keep contests whose type contains one of these
+            multi_entry_only: Only keep contests allowing multiple entries
+
+        Returns:
+            List of YahooContest objects that pass the filters
+        """
         try:
-            contests = []
+            if now is None:
+                now = datetime.now()
             
             # Handle nested structure: response['contests']['result']
-            if 'contests' in response and 'result' in response['contests']:
-                contests_data = response['contests']['result']
-            else:
+            contests_data = (response.get('contests') or {}).get('result')
+            if not isinstance(contests_data, list):
                 self.logger.warning("No contests found in API response")
                 return []
             
+            contest_types_lower = [ct.lower() for ct in contest_types or ()]
+
+            # _parse_contest_data already logs and returns None for contests
+            # it cannot parse, so no per-item exception handling is needed
+            parse_contest = self._parse_contest_data
+            contests = []
             for contest_data in contests_data:
-                try:
-                    contest = self._parse_contest_data(contest_data)
-                    if contest:
-                        contests.append(contest)
-                except Exception as e:
-                    self.logger.warning(f"Failed to parse contest: {e}")
+                contest = parse_contest(contest_data, now)
+                if contest is None:
                     continue
-            
+                if multi_entry_only and contest.max_entries_per_user <= 1:
+                    continue
+                if contest_types_lower:
+                    contest_type = contest.contest_type.lower()
+                    if not any(ct in contest_type for ct in contest_types_lower):
+                        continue
+                contests.append(contest)
+
+            self.logger.info(
+                f"Parsed {len(contests_data)} contests, {len(contests)} match filters"
+            )
             return contests
             
         except Exception as e:
             self.logger.error(f"Failed to parse API response: {e}")
             return []
 
-    def _parse_contest_data(self, contest_data: Dict[str, Any]) -> Optional[YahooContest]:
+    def _parse_contest_data(
+        self, contest_data: Dict[str, Any], now: Optional[datetime] = None
+    ) -> Optional[YahooContest]:
         """Parse individual contest data from the API response."""
         try:
-            # Extract basic contest information
-            contest_id = str(contest_data.get("id", ""))
-            contest_name = contest_data.get("title", "")
+            # Extract all contest fields in one pass, filling in missing keys
+            (
+                contest_id,
+                contest_name,
+                entry_fee_data,
+                total_prize_pool_data,
+                max_entries,
+                max_entries_per_user,
+                start_time,
+                slate_type,
+                salary_cap,
+                sport_code,
+                guaranteed,
+            ) = _extract_contest_fields({**_CONTEST_DEFAULTS, **contest_data})
+            contest_id = str(contest_id)
+            name_lower = (contest_name or "").lower()
             
             # Handle nested monetary values
-            entry_fee_data = contest_data.get("paidEntryFee", {})
             if isinstance(entry_fee_data, dict):
                 entry_fee = entry_fee_data.get("value", 0)
             else:
                 entry_fee = entry_fee_data
             
-            total_prize_pool_data = contest_data.get("paidTotalPrize", {})
             if isinstance(total_prize_pool_data, dict):
                 total_prize_pool = total_prize_pool_data.get("value", 0)
             else:
                 total_prize_pool = total_prize_pool_data
             
-            max_entries = contest_data.get("entryLimit", 0)
-            max_entries_per_user = contest_data.get("multipleEntryLimit", 1)
-            start_time = contest_data.get("startTime", "")
-            slate_type = contest_data.get("slateType", "UNKNOWN")
-            salary_cap = contest_data.get("salaryCap", 0)
-            
             # Extract sport from contest data
-            sport_code = contest_data.get("sportCode", "nfl")
             sport = self._get_sport_type(sport_code)
             
             # Parse start time to get contest date
@@ -218,7 +401,10 @@ class YahooDFSCollector(BaseAPICollector):
                 max_entries=int(max_entries),
                 max_entries_per_user=int(max_entries_per_user),
                 slate_type=slate_type,
-                salary_cap=int(salary_cap)
+                salary_cap=int(salary_cap),
+                contest_type=self._determine_contest_type(contest_data, name_lower),
+                guaranteed=bool(guaranteed),
+                last_updated=now,
             )
             
             return contest
@@ -232,41 +418,38 @@ class YahooDFSCollector(BaseAPICollector):
         try:
             if start_time:
                 # Convert milliseconds timestamp to date
-                timestamp_ms = int(start_time)
-                return datetime.fromtimestamp(timestamp_ms / 1000).date()
+                return _epoch_seconds_to_date(int(start_time) // 1000)
             return None
         except (ValueError, TypeError):
             return None
     
     def _get_sport_type(self, sport_code: str) -> SportType:
         """Convert sport code to SportType enum."""
-        sport_mapping = {
-            'nfl': SportType.NFL,
-            'nba': SportType.NBA,
-            'mlb': SportType.MLB,
-            'nhl': SportType.NHL
-        }
-        return sport_mapping.get(sport_code.lower(), SportType.NFL)
+        return _SPORT_BY_CODE.get(sport_code.lower(), SportType.NFL)
+
+    def _determine_contest_type(
+        self, contest_data: Dict[str, Any], name_lower: Optional[str] = None
+    ) -> str:
+        """Determine the contest type from the data.
 
-    def _determine_contest_type(self, contest_data: Dict[str, Any]) -> str:
-        """Determine the contest type from the data."""
-        contest_name = contest_data.get("title", "").lower()
+        Args:
+            contest_data: Raw contest data from the API
+            name_lower: Already lower-cased contest title, if the caller has one
+
+        Returns:
+            Human readable contest type
+        """
+        if name_lower is None:
+            name_lower = (contest_data.get("title") or "").lower()
         contest_type = contest_data.get("type", "")
         
-        if "guaranteed" in contest_name:
-            return "Guaranteed"
-        elif "qualifier" in contest_name:
-            return "Qualifier"
-        elif "satellite" in contest_name:
-            return "Satellite"
-        elif contest_type == "50-50":
-            return "50/50"
-        elif contest_type == "head2head":
-            return "Head-to-Head"
-        elif contest_type == "league":
-            return "League"
-        else:
-            return contest_type.title() if contest_type else "Standard"
+        for keyword, label in _CONTEST_NAME_KEYWORDS:
+            if keyword in name_lower:
+                return label
+        label = _CONTEST_TYPE_LABELS.get(contest_type)
+        if label:
+            return label
+        return contest_type.title() if contest_type else "Standard"
 
     def _determine_entry_limit_type(self, contest_data: Dict[str, Any]) -> str:
         """Determine the entry limit type from the data."""
@@ -308,16 +491,10 @@ class YahooDFSCollector(BaseAPICollector):
             self.logger.info(f"Fetching players for contest {contest_id}")
 
             # This endpoint returns CSV, so we need to make a direct request
-            url = f"https://dfyql-ro.sports.yahoo.com/v2/{endpoint}"
-
-            if not self.session:
-                import aiohttp
-                self.session = aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-                    headers=self.config.headers or {},
-                )
+            # on the collector's shared session
+            url = f"{self.config.base_url}/{endpoint}"
 
-            async with self.session.get(url) as response:
+            async with self._ensure_session().get(url) as response:
                 if response.status == 200:
                     csv_content = await response.text()
                     players = self._parse_csv_players(csv_content)
@@ -331,6 +508,28 @@ class YahooDFSCollector(BaseAPICollector):
             self.logger.error(f"Failed to fetch players for contest {contest_id}: {e}")
             return []
 
+    async def get_players_for_contests(
+        self, contest_ids: List[str], max_concurrency: int = 5
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch player information for several contests concurrently.
+
+        Args:
+            contest_ids: The Yahoo contest IDs
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Dictionary mapping contest IDs to their player lists
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(contest_id: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_contest_players(contest_id)
+
+        results = await asyncio.gather(*(fetch(cid) for cid in contest_ids))
+        return dict(zip(contest_ids, results))
+
     def _parse_csv_players(self, csv_content: str) -> List[Dict[str, Any]]:
         """Parse CSV content from the contest players endpoint."""
         try:
@@ -341,27 +540,20 @@ class YahooDFSCollector(BaseAPICollector):
             csv_file = StringIO(csv_content)
             csv_reader = csv.DictReader(csv_file)
             
+            fieldnames = csv_reader.fieldnames or []
+            has_name_columns = "First Name" in fieldnames and "Last Name" in fieldnames
+            
             for row in csv_reader:
-                # Convert row to dict and clean up values
-                player = {}
-                for key, value in row.items():
-                    if value and value.strip():
-                        # Try to convert numeric values
-                        try:
-                            if '.' in value:
-                                player[key] = float(value)
-                            else:
-                                player[key] = int(value)
-                        except ValueError:
-                            player[key] = value.strip()
-                    else:
-                        player[key] = None
+                # Convert row to dict and clean up values; numeric cells are
+                # detected up front instead of by catching ValueError
+                player = {key: _coerce_csv_value(value) for key, value in row.items()}
                 
                 # Construct full name from First Name and Last Name
-                first_name = player.get('First Name', '')
-                last_name = player.get('Last Name', '')
-                if first_name and last_name:
-                    player['name'] = f"{first_name} {last_name}"
+                if has_name_columns:
+                    first_name = player['First Name']
+                    last_name = player['Last Name']
+                    if first_name and last_name:
+                        player['name'] = f"{first_name} {last_name}"
                 
                 players.append(player)
             
@@ -371,20 +563,42 @@ class YahooDFSCollector(BaseAPICollector):
             self.logger.error(f"Failed to parse CSV players: {e}")
             return []
 
-    async def get_contest_game_info(self, contest_id: str) -> Dict[str, Any]:
+    async def get_contest_game_info(
+        self,
+        contest_id: str,
+        contests: Optional[List[YahooContest]] = None,
+        ttl: float = CONTEST_CACHE_TTL,
+    ) -> Dict[str, Any]:
         """
         Fetch game information for a specific contest.
 
         Args:
             contest_id: The Yahoo contest ID
+            contests: Previously collected contests to search; looked up
+                in (or refreshed into) the contest cache when not provided
+            ttl: Seconds a cached contest stays valid
 
         Returns:
             Dictionary containing game information including game ID
         """
         try:
             # First get the contest details to find the game
-            contests = await self.collect_contests(SportType.NFL, multi_entry_only=False)
-            contest = next((c for c in contests if c.contest_id == contest_id), None)
+            if contests is not None:
+                contest = next(
+                    (c for c in contests if c.contest_id == contest_id), None
+                )
+            else:
+                contest = None
+                cached = self._contest_by_id.get(contest_id)
+                if cached and time.monotonic() - cached[0] < ttl:
+                    contest = cached[1]
+                else:
+                    fresh = await self.collect_contests_cached(
+                        SportType.NFL, multi_entry_only=False, ttl=ttl
+                    )
+                    contest = next(
+                        (c for c in fresh if c.contest_id == contest_id), None
+                    )
             
             if not contest:
                 self.logger.error(f"Contest {contest_id} not found")
@@ -400,14 +614,13 @@ class YahooDFSCollector(BaseAPICollector):
                 "teams": [],  # Will be populated from player data
             }
             
-            # Get players to extract team information
+            # Get players to extract team information (in first-seen order)
             players = await self.get_contest_players(contest_id)
-            teams = set()
-            for player in players:
-                if player.get('team'):
-                    teams.add(player['team'])
-            
-            game_info['teams'] = list(teams)
+            game_info['teams'] = list(
+                dict.fromkeys(
+                    team for player in players if (team := player.get('team'))
+                )
+            )
             
             return game_info
 
@@ -429,31 +642,31 @@ class YahooDFSCollector(BaseAPICollector):
             # Get basic player information
             players = await self.get_contest_players(contest_id)
             
-            # Get game information
-            game_info = await self.get_contest_game_info(contest_id)
-            
-            # Enhance player data with IDs
+            # Enhance player data with IDs. The players were fetched just for
+            # this call, so they are updated in place rather than copied.
+            game_ids: Dict[Any, str] = {}
             enhanced_players = []
             for player in players:
                 # Use the actual Yahoo player ID from the CSV
                 yahoo_player_id = player.get('ID', '')
                 
-                # Extract game ID from the Game field (e.g., "DAL@PHI" -> generate game ID)
+                # Extract game ID from the Game field (e.g., "DAL@PHI" -> generate game ID);
+                # a slate only has a handful of games, so compute each one once
                 game_field = player.get('Game', '')
-                if game_field and '@' in game_field:
-                    # Generate a game ID based on the teams and contest
-                    game_id = f"nfl.g.{hash(game_field + contest_id) % 100000000}"
-                else:
-                    game_id = f"nfl.g.{contest_id}"
+                game_id = game_ids.get(game_field)
+                if game_id is None:
+                    if game_field and '@' in game_field:
+                        # Generate a game ID based on the teams and contest
+                        game_id = f"nfl.g.{hash(game_field + contest_id) % 100000000}"
+                    else:
+                        game_id = f"nfl.g.{contest_id}"
+                    game_ids[game_field] = game_id
                 
-                enhanced_player = player.copy()
-                enhanced_player.update({
-                    'yahoo_player_id': yahoo_player_id,
-                    'game_id': game_id,
-                    'full_yahoo_id': f"{game_id}${yahoo_player_id}",
-                    'sport': 'nfl',
-                })
-                enhanced_players.append(enhanced_player)
+                player['yahoo_player_id'] = yahoo_player_id
+                player['game_id'] = game_id
+                player['full_yahoo_id'] = f"{game_id}${yahoo_player_id}"
+                player['sport'] = 'nfl'
+                enhanced_players.append(player)
             
             self.logger.info(f"Enhanced {len(enhanced_players)} players with Yahoo IDs")
             return enhanced_players
@@ -474,23 +687,20 @@ class YahooDFSCollector(BaseAPICollector):
         """
         players = await self.get_players_with_ids(contest_id)
         
-        standardized = {}
-        for player in players:
-            name = self._standardize_name(player.get("name", ""))
-            if name:
-                standardized[name] = player
-        
-        return standardized
+        standardize = self._standardize_name
+        return {
+            name: player
+            for player in players
+            if (name := standardize(player.get("name", "")))
+        }
 
     def _standardize_name(self, name: str) -> str:
         """Standardize player name to Yahoo format."""
-        if not name:
-            return ""
-        return re.sub(r'\s+', ' ', name.strip()).lower()
+        return _standardize_player_name(name)
 
     def get_available_sports(self) -> List[SportType]:
         """Get list of available sports."""
-        return list(self.sport_codes.keys())
+        return list(_SPORT_CODES)
 
     def get_available_dates(self, sport: SportType) -> List[date]:
         """Get available dates for a sport (not applicable for current API)."""
@@ -502,25 +712,35 @@ class YahooDFSCollector(BaseAPICollector):
             return {}
         
         total_contests = len(contests)
-        total_prize_pools = sum(c.total_prize_pool for c in contests)
-        total_entry_fees = sum(c.entry_fee for c in contests)
-        
-        # Entry fee distribution
-        entry_fee_ranges = {
-            "$1-5": len([c for c in contests if 1 <= c.entry_fee <= 5]),
-            "$6-20": len([c for c in contests if 6 <= c.entry_fee <= 20]),
-            "$21-100": len([c for c in contests if 21 <= c.entry_fee <= 100]),
-            "$101+": len([c for c in contests if c.entry_fee > 100]),
-        }
-        
-        # Contest type distribution
-        contest_types = {}
+        total_prize_pools = 0.0
+        total_entry_fees = 0.0
+        multi_entry_count = 0
+        contest_types: Counter = Counter()
+        entry_fee_ranges = {"$1-5": 0, "$6-20": 0, "$21-100": 0, "$101+": 0}
+
+        # Gather every statistic in a single pass over the contests
         for contest in contests:
-            contest_type = contest.contest_type
-            contest_types[contest_type] = contest_types.get(contest_type, 0) + 1
-        
-        # Multi-entry vs single-entry
-        multi_entry_count = len([c for c in contests if c.max_entries_per_user > 1])
+            entry_fee = contest.entry_fee
+            total_prize_pools += contest.total_prize_pool
+            total_entry_fees += entry_fee
+
+            # Entry fee distribution
+            if 1 <= entry_fee <= 5:
+                entry_fee_ranges["$1-5"] += 1
+            elif 6 <= entry_fee <= 20:
+                entry_fee_ranges["$6-20"] += 1
+            elif 21 <= entry_fee <= 100:
+                entry_fee_ranges["$21-100"] += 1
+            elif entry_fee > 100:
+                entry_fee_ranges["$101+"] += 1
+
+            # Contest type distribution
+            contest_types[contest.contest_type] += 1
+
+            # Multi-entry vs single-entry
+            if contest.max_entries_per_user > 1:
+                multi_entry_count += 1
+
         single_entry_count = total_contests - multi_entry_count
         
         return {
@@ -530,7 +750,7 @@ class YahooDFSCollector(BaseAPICollector):
             "average_prize_pool": total_prize_pools / total_contests if total_contests > 0 else 0,
             "average_entry_fee": total_entry_fees / total_contests if total_contests > 0 else 0,
             "entry_fee_distribution": entry_fee_ranges,
-            "contest_type_distribution": contest_types,
+            "contest_type_distribution": dict(contest_types),
             "multi_entry_count": multi_entry_count,
             "single_entry_count": single_entry_count,
             "multi_entry_percentage": (multi_entry_count / total_contests * 100) if total_contests > 0 else 0,
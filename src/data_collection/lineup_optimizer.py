@@ -10,26 +10,57 @@ This script demonstrates how to:
 
 import asyncio
 import csv
+from bisect import bisect_right, insort
+import hashlib
+import os
 import sys
+import tempfile
+import time
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 
 from . import YahooDFSCollector, SportType
 
 
-def load_projections_from_csv(csv_file: str) -> List[Dict[str, Any]]:
-    """Load player projections from CSV file."""
-    projections = []
+# Low-cardinality projection columns repeated across sources; interning them
+# lets every row share one string object per distinct value
+_INTERNED_COLUMNS = ("player_name", "position", "team", "opponent")
+
+
+def iter_projections_from_csv(csv_file: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream player projections from a CSV file one row at a time.
+    
+    Args:
+        csv_file: Path to the projections CSV
+        
+    Yields:
+        One projection row per CSV line
+    """
+    intern = sys.intern
     
     with open(csv_file, 'r', encoding='utf-8') as file:
         reader = csv.DictReader(file)
+        interned_columns = [
+            column for column in _INTERNED_COLUMNS
+            if column in (reader.fieldnames or ())
+        ]
         for row in reader:
-            projections.append(row)
-    
-    return projections
+            for column in interned_columns:
+                value = row[column]
+                if value is not None:
+                    row[column] = intern(value)
+            yield row
 
 
-def create_yahoo_players_csv(projections: List[Dict[str, Any]], output_file: str, use_consensus: bool = False) -> None:
+def load_projections_from_csv(csv_file: str) -> List[Dict[str, Any]]:
+    """Load player projections from CSV file."""
+    return list(iter_projections_from_csv(csv_file))
+
+
+def create_yahoo_players_csv(projections: Iterable[Dict[str, Any]], output_file: str, use_consensus: bool = False) -> None:
     """
     Create Yahoo-compatible CSV format for the optimizer.
     
@@ -37,21 +68,24 @@ def create_yahoo_players_csv(projections: List[Dict[str, Any]], output_file: str
     - First Name, Last Name, Position, Team, Salary, FPPG
     
     Args:
-        projections: List of player projections
+        projections: Player projections; any iterable works, including the
+            stream from iter_projections_from_csv(), and it is consumed once
         output_file: Output CSV file path
         use_consensus: If True, use consensus projections for FPPG instead of actual FPPG
     """
-    # Group projections by player to get consensus
+    # Group projections by player, keeping a running sum and count so the
+    # consensus can be computed without holding every projection
     player_data = {}
     
     for proj in projections:
         player_name = proj["player_name"]
-        source = proj["source"]
         projection = float(proj["projection"])
         
-        if player_name not in player_data:
-            player_data[player_name] = {
-                "projections": [],
+        data = player_data.get(player_name)
+        if data is None:
+            data = player_data[player_name] = {
+                "projection_sum": 0.0,
+                "projection_count": 0,
                 "position": proj["position"],
                 "team": proj["team"],
                 "salary": int(proj["salary"]),
@@ -60,14 +94,8 @@ def create_yahoo_players_csv(projections: List[Dict[str, Any]], output_file: str
                 "game_time": proj["game_time"]
             }
         
-        player_data[player_name]["projections"].append(projection)
-    
-    # Calculate consensus projection (simple average for now)
-    for player_name, data in player_data.items():
-        if data["projections"]:
-            data["consensus_projection"] = sum(data["projections"]) / len(data["projections"])
-        else:
-            data["consensus_projection"] = 0.0
+        data["projection_sum"] += projection
+        data["projection_count"] += 1
     
     # Write Yahoo-compatible CSV
     with open(output_file, 'w', newline='', encoding='utf-8') as file:
@@ -76,41 +104,43 @@ def create_yahoo_players_csv(projections: List[Dict[str, Any]], output_file: str
             "Salary", "FPPG", "Injury Status", "Consensus Projection"
         ]
         
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(file)
+        writer.writerow(fieldnames)
+        
+        # Generate a simple ID (hash of name) for every player up front
+        player_ids = {
+            player_name: hashlib.md5(
+                player_name.encode(), usedforsecurity=False
+            ).hexdigest()[:8]
+            for player_name in player_data
+        }
         
         for player_name, data in player_data.items():
             # Split player name into first and last
-            name_parts = player_name.split()
-            if len(name_parts) >= 2:
-                first_name = name_parts[0]
-                last_name = " ".join(name_parts[1:])
-            else:
-                first_name = player_name
-                last_name = ""
+            first_name, _, last_name = player_name.partition(" ")
             
             # Create game info (Team@Opponent format)
             game = f"{data['team']}@{data['opponent']}" if data['team'] and data['opponent'] else ""
             
-            # Generate a simple ID (hash of name)
-            import hashlib
-            player_id = hashlib.md5(player_name.encode()).hexdigest()[:8]
+            # Calculate consensus projection (simple average for now)
+            consensus_projection = data["projection_sum"] / data["projection_count"]
             
             # Use consensus projections for FPPG if requested
-            fppg_value = data["consensus_projection"] if use_consensus else data["fppg"]
+            fppg_value = consensus_projection if use_consensus else data["fppg"]
             
-            writer.writerow({
-                "ID": player_id,
-                "First Name": first_name,
-                "Last Name": last_name,
-                "Position": data["position"],
-                "Team": data["team"],
-                "Game": game,
-                "Salary": data["salary"],
-                "FPPG": round(fppg_value, 1),
-                "Injury Status": "",  # No injury data in our dummy projections
-                "Consensus Projection": round(data["consensus_projection"], 1),
-            })
+            # Values in fieldnames order
+            writer.writerow((
+                player_ids[player_name],
+                first_name,
+                last_name,
+                data["position"],
+                data["team"],
+                game,
+                data["salary"],
+                f"{fppg_value:.1f}",
+                "",  # No injury data in our dummy projections
+                f"{consensus_projection:.1f}",
+            ))
     
     projection_type = "consensus" if use_consensus else "FPPG"
     print(f"✅ Created Yahoo-compatible CSV: {output_file}")
@@ -118,12 +148,44 @@ def create_yahoo_players_csv(projections: List[Dict[str, Any]], output_file: str
     print(f"🎯 Using {projection_type} projections for optimization")
 
 
-async def get_contest_info() -> Dict[str, Any]:
-    """Get contest information including salary cap from Yahoo DFS."""
-    yahoo_collector = YahooDFSCollector()
+# Contest info from recent get_contest_info() calls, keyed by sport
+CONTEST_INFO_TTL = 300.0  # seconds
+_contest_info_cache: Dict[SportType, Tuple[float, Dict[str, Any]]] = {}
+
+
+async def get_contest_info(
+    sport: SportType = SportType.NFL,
+    ttl: float = CONTEST_INFO_TTL,
+    yahoo_collector: Optional[YahooDFSCollector] = None,
+) -> Dict[str, Any]:
+    """
+    Get contest information including salary cap from Yahoo DFS.
     
-    # Get NFL contests
-    contests = await yahoo_collector.collect_contests(SportType.NFL, multi_entry_only=True)
+    Results are reused for ``ttl`` seconds so repeated optimization runs
+    don't refetch the contest list.
+    
+    Args:
+        sport: The sport to get contest information for
+        ttl: Seconds a cached result stays valid
+        yahoo_collector: Collector (and HTTP session) to reuse; a temporary
+            one is created and closed when omitted
+        
+    Returns:
+        Contest information for the first multi-entry contest
+    """
+    now = time.monotonic()
+    cached = _contest_info_cache.get(sport)
+    if cached and now - cached[0] < ttl:
+        return dict(cached[1])
+    
+    if yahoo_collector is None:
+        temporary_collector = YahooDFSCollector()
+        try:
+            return await get_contest_info(sport, ttl, temporary_collector)
+        finally:
+            await temporary_collector.cleanup()
+    
+    contests = await yahoo_collector.collect_contests(sport, multi_entry_only=True)
     
     if not contests:
         raise ValueError("No contests found")
@@ -142,6 +204,7 @@ async def get_contest_info() -> Dict[str, Any]:
         "contest_type": contest.contest_type,
         "guaranteed": contest.guaranteed,
     }
+    _contest_info_cache[sport] = (now, contest_info)
     
     print(f"📊 Contest: {contest.contest_name}")
     print(f"💰 Entry Fee: ${contest.entry_fee}")
@@ -149,17 +212,200 @@ async def get_contest_info() -> Dict[str, Any]:
     print(f"👥 Max Entries: {contest.max_entries}")
     print(f"🎯 Max Per User: {contest.max_entries_per_user}")
     
-    return contest_info
+    # Return a copy, as on a cache hit, so callers can't modify the cached entry
+    return dict(contest_info)
+
+
+async def get_contest_infos(
+    sports: Iterable[SportType], ttl: float = CONTEST_INFO_TTL
+) -> Dict[SportType, Dict[str, Any]]:
+    """
+    Get contest information for several sports concurrently.
+    
+    All fetches share one collector, so they reuse a single HTTP session.
+    
+    Args:
+        sports: The sports to get contest information for
+        ttl: Seconds a cached result stays valid
+        
+    Returns:
+        Dictionary mapping each sport to its contest information
+    """
+    sports = list(dict.fromkeys(sports))
+    yahoo_collector = YahooDFSCollector()
+    try:
+        contest_infos = await asyncio.gather(
+            *(get_contest_info(sport, ttl, yahoo_collector) for sport in sports)
+        )
+    finally:
+        await yahoo_collector.cleanup()
+    
+    return dict(zip(sports, contest_infos))
+
 
+# Roster sizes of Yahoo NFL contests (single game: 1 MVP + 4 UTIL)
+MULTI_GAME_ROSTER_SIZE = 9
+SINGLE_GAME_ROSTER_SIZE = 5
 
-def optimize_lineups(projections_file: str, contest_info: Dict[str, Any], num_lineups: int = 1) -> List[Dict[str, Any]]:
+
+def prune_dominated_players(
+    yahoo_csv_path: str,
+    output_csv_path: str,
+    roster_size: int,
+    by_position: bool = True,
+) -> int:
+    """
+    Write a copy of a Yahoo players CSV without dominated players.
+    
+    A player is dominated when at least ``roster_size`` other players (of the
+    same position when ``by_position``) cost no more and project at least as
+    many points. Without team constraints, any lineup using such a player can
+    swap in one of them, so the best lineup never needs the dominated player
+    and the optimizer can skip it.
+    
+    Dominance ignores teams: with team constraints (max players per team,
+    minimum number of teams, stacking) a dominated player from another team
+    may be required, so the pruned player pool can yield a worse or no
+    lineup. Later lineups in a multi-lineup run may also differ, since they
+    are only required to be unique. Pruning is therefore opt-in.
+    
+    Args:
+        yahoo_csv_path: Path to Yahoo format CSV
+        output_csv_path: Path to save the pruned CSV
+        roster_size: Number of players in a lineup
+        by_position: Compare players only within their position (set False
+            when every roster slot accepts any position)
+        
+    Returns:
+        Number of players removed
+    """
+    with open(yahoo_csv_path, 'r', newline='', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        fieldnames = reader.fieldnames or []
+        rows = list(reader)
+    
+    # Group players as (salary, -FPPG, row index) so sorting puts cheaper,
+    # then higher projected, players first
+    groups: Dict[str, List[Tuple[float, float, int]]] = {}
+    for index, row in enumerate(rows):
+        key = row['Position'] if by_position else ''
+        groups.setdefault(key, []).append(
+            (float(row['Salary']), -float(row['FPPG']), index)
+        )
+    
+    dominated = set()
+    for players in groups.values():
+        players.sort()
+        # Negated FPPG of every player seen so far, all costing no more
+        seen = []
+        for _, negated_fppg, index in players:
+            if bisect_right(seen, negated_fppg) >= roster_size:
+                dominated.add(index)
+            insort(seen, negated_fppg)
+    
+    with open(output_csv_path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(
+            row for index, row in enumerate(rows) if index not in dominated
+        )
+    
+    return len(dominated)
+
+
+# Memory-backed filesystem for the intermediate single game CSV where available
+_MEMORY_TEMP_DIR = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
+
+
+@lru_cache(maxsize=4)
+def _build_optimizer(
+    projections_file: str,
+    mtime_ns: int,
+    size: int,
+    salary_cap: int,
+    is_single_game: bool,
+    prune_dominated: bool = False,
+) -> Tuple[Any, List[Any]]:
+    """
+    Create an optimizer with players loaded from the projections file.
+    
+    Cached per file modification time, size and contest settings so
+    repeated runs skip CSV conversion and player loading.
+    
+    Every caller with the same key gets the same optimizer and lineups list,
+    and optimize_lineups() fills that list in place, so the cached optimizer
+    must not be used from more than one thread at a time.
+    
+    Args:
+        projections_file: Path to Yahoo format CSV with player projections
+        mtime_ns: Modification time of projections_file (cache key only)
+        size: Size of projections_file in bytes (cache key only; catches
+            rewrites within the same timestamp tick)
+        salary_cap: Salary cap for the contest
+        is_single_game: Whether to build a single game optimizer
+        prune_dominated: Whether to drop dominated players before loading
+        
+    Returns:
+        Tuple of the loaded optimizer and a list of lineups solved with it
+    """
+    from pydfs_lineup_optimizer import get_optimizer, Site, Sport
+    
+    # Intermediate CSVs live in a private temporary directory that is removed
+    # as soon as players are loaded
+    with tempfile.TemporaryDirectory(dir=_MEMORY_TEMP_DIR) as temp_dir:
+        players_csv = projections_file
+        if prune_dominated:
+            players_csv = os.path.join(temp_dir, "pruned_players.csv")
+            removed = prune_dominated_players(
+                projections_file,
+                players_csv,
+                SINGLE_GAME_ROSTER_SIZE if is_single_game else MULTI_GAME_ROSTER_SIZE,
+                by_position=not is_single_game,
+            )
+            print(f"✂️ Pruned {removed} dominated players")
+        
+        if is_single_game:
+            # Convert Yahoo CSV to FanDuel single game format
+            fanduel_csv = os.path.join(temp_dir, "fanduel_single_game.csv")
+            convert_yahoo_to_fanduel_single_game_csv(players_csv, fanduel_csv)
+            optimizer = create_yahoo_single_game_optimizer(salary_cap)
+            optimizer.load_players_from_csv(fanduel_csv)
+        else:
+            optimizer = get_optimizer(Site.YAHOO, Sport.FOOTBALL)
+            optimizer.settings.budget = salary_cap
+            optimizer.load_players_from_csv(players_csv)
+    
+    return optimizer, []
+
+
+# Attribute names pydfs versions use for projected points, in lookup order
+_POINTS_ATTRIBUTES = ('fantasy_points', 'points', 'projected_points')
+
+
+def _points_getter(obj: Any) -> Callable[[Any], float]:
+    """Return a getter for the first points attribute ``obj`` has (else 0.0)."""
+    for name in _POINTS_ATTRIBUTES:
+        if hasattr(obj, name):
+            return attrgetter(name)
+    return lambda _: 0.0
+
+
+def optimize_lineups(projections_file: str, contest_info: Dict[str, Any], num_lineups: int = 1, prune_dominated: bool = False) -> List[Dict[str, Any]]:
     """
     Optimize lineups using pydfs-lineup-optimizer.
     
+    Loaded optimizers are cached and shared between calls, so don't call this
+    concurrently from several threads for the same projections file.
+    
     Args:
         projections_file: Path to CSV file with player projections
         contest_info: Contest information including slate_type and salary_cap
         num_lineups: Number of lineups to generate
+        prune_dominated: Drop players that can't improve the best lineup when
+            no team constraints apply
+            before loading them (see prune_dominated_players)
         
     Returns:
         List of optimized lineups
@@ -175,38 +421,33 @@ def optimize_lineups(projections_file: str, contest_info: Dict[str, Any], num_li
         print(f"🎯 Contest Type: {'Single Game' if is_single_game else 'Multi Game'}")
         print(f"💰 Salary Cap: ${salary_cap:,}")
         
-        # Create the appropriate optimizer based on contest type
         if is_single_game:
             print(f"🏈 Single Game Contest - Using 5-player structure (1 MVP + 4 UTIL)")
-            # Convert Yahoo CSV to FanDuel single game format
-            import tempfile
-            import os
-            
-            # Create temporary FanDuel CSV
-            temp_dir = tempfile.gettempdir()
-            fanduel_csv = os.path.join(temp_dir, f"fanduel_single_game_{os.getpid()}.csv")
-            
-            try:
-                convert_yahoo_to_fanduel_single_game_csv(projections_file, fanduel_csv)
-                optimizer = create_yahoo_single_game_optimizer(salary_cap)
-                optimizer.load_players_from_csv(fanduel_csv)
-            finally:
-                # Clean up temporary file
-                if os.path.exists(fanduel_csv):
-                    os.unlink(fanduel_csv)
         else:
             print(f"🏈 Multi Game Contest - Using standard 9-player structure")
-            optimizer = get_optimizer(Site.YAHOO, Sport.FOOTBALL)
-            optimizer.settings.budget = salary_cap
-            optimizer.load_players_from_csv(projections_file)
+        
+        # Reuse the loaded optimizer (and any lineups it already solved) while
+        # the projections file and contest settings are unchanged
+        stat = os.stat(projections_file)
+        optimizer, solved_lineups = _build_optimizer(
+            projections_file,
+            stat.st_mtime_ns,
+            stat.st_size,
+            salary_cap,
+            is_single_game,
+            prune_dominated,
+        )
         
         print(f"📊 Loaded {len(optimizer.players)} players")
         print(f"🎯 Available positions: {', '.join(sorted(optimizer.available_positions))}")
         print(f"💰 Budget: ${optimizer.budget:,}")
         
-        # Generate lineups
+        # Generate lineups; optimize() is deterministic, so a smaller request
+        # is served from the lineups an earlier, larger run produced
         print(f"🚀 Generating {num_lineups} lineup(s)...")
-        lineups = list(optimizer.optimize(num_lineups))
+        if len(solved_lineups) < num_lineups:
+            solved_lineups[:] = optimizer.optimize(num_lineups)
+        lineups = solved_lineups[:num_lineups]
         
         if not lineups:
             print("❌ No valid lineups found!")
@@ -214,14 +455,17 @@ def optimize_lineups(projections_file: str, contest_info: Dict[str, Any], num_li
         
         print(f"✅ Successfully generated {len(lineups)} lineup(s)")
         
+        # Resolve the points attributes once; every lineup (and lineup player)
+        # comes from the same optimizer, so they share a type
+        lineup_points = _points_getter(lineups[0])
+        player_points = _points_getter(next(iter(lineups[0].lineup), None))
+        
         # Convert lineups to our format
         formatted_lineups = []
         for i, lineup in enumerate(lineups):
             try:
                 # Get total fantasy points
-                fantasy_points = getattr(lineup, 'fantasy_points', 
-                                      getattr(lineup, 'points', 
-                                             getattr(lineup, 'projected_points', 0.0)))
+                fantasy_points = lineup_points(lineup)
                 
                 # Get total salary
                 total_salary = sum(player.salary for player in lineup.lineup)
@@ -229,17 +473,12 @@ def optimize_lineups(projections_file: str, contest_info: Dict[str, Any], num_li
                 # Format players
                 players = []
                 for player in lineup.lineup:
-                    # Get player fantasy points
-                    player_points = getattr(player, 'fantasy_points', 
-                                          getattr(player, 'points', 
-                                                 getattr(player, 'projected_points', 0.0)))
-                    
                     players.append({
                         "player_name": player.first_name + " " + player.last_name,
                         "position": '/'.join(player.positions),
                         "team": player.team,
                         "salary": player.salary,
-                        "projection": player_points,
+                        "projection": player_points(player),
                         "fppg": player.fppg
                     })
                 
@@ -278,49 +517,45 @@ def convert_yahoo_to_fanduel_single_game_csv(yahoo_csv_path: str, fanduel_csv_pa
         yahoo_csv_path: Path to Yahoo format CSV
         fanduel_csv_path: Path to save FanDuel format CSV
     """
-    import pandas as pd
-    import csv
-    
-    # Read Yahoo CSV
-    df = pd.read_csv(yahoo_csv_path)
-    
-    # Create FanDuel single game CSV
-    with open(fanduel_csv_path, 'w', newline='', encoding='utf-8') as file:
-        fieldnames = ['Id', 'First Name', 'Last Name', 'Position', 'Team', 'Salary', 'FPPG', 'Game', 'Injury Indicator']
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
+    with open(yahoo_csv_path, 'r', newline='', encoding='utf-8') as infile, \
+            open(fanduel_csv_path, 'w', newline='', encoding='utf-8') as outfile:
+        reader = csv.reader(infile)
+        writer = csv.writer(outfile)
         
-        for _, row in df.iterrows():
-            # Split name into first and last
-            full_name = row['First Name']
-            name_parts = full_name.split()
-            if len(name_parts) >= 2:
-                first_name = name_parts[0]
-                last_name = ' '.join(name_parts[1:])
-            else:
-                first_name = full_name
-                last_name = ''
-            
-            # Create game info (Team@Opponent format)
-            game = row['Game'] if pd.notna(row['Game']) else f"{row['Team']}@OPP"
+        # Resolve the Yahoo column positions once from the header and build a
+        # single extractor for them; Injury Status is optional
+        header = next(reader, [])
+        column = {name: i for i, name in enumerate(header)}
+        fields = ['ID', 'First Name', 'Position', 'Team', 'Salary', 'FPPG', 'Game']
+        if 'Injury Status' in column:
+            fields.append('Injury Status')
+        extract = itemgetter(*(column[field] for field in fields))
+        
+        writer.writerow([
+            'Id', 'First Name', 'Last Name', 'Position', 'Team', 'Salary', 'FPPG',
+            'Game', 'Injury Indicator'
+        ])
+        
+        for row in reader:
+            player_id, full_name, position, team, salary, fppg, game, *injury = (
+                extract(row)
+            )
             
-            # Handle injury indicator
-            injury_indicator = row.get('Injury Status', '')
-            if pd.isna(injury_indicator):
-                injury_indicator = ''
+            # Split name into first and last
+            first_name, _, last_name = full_name.partition(' ')
             
-            # Write row in FanDuel format
-            writer.writerow({
-                'Id': row['ID'],
-                'First Name': first_name,
-                'Last Name': last_name,
-                'Position': row['Position'],
-                'Team': row['Team'],
-                'Salary': row['Salary'],
-                'FPPG': row['FPPG'],
-                'Game': game,
-                'Injury Indicator': injury_indicator
-            })
+            # Write row in FanDuel format; games default to Team@OPP
+            writer.writerow((
+                player_id,
+                first_name,
+                last_name,
+                position,
+                team,
+                salary,
+                fppg,
+                game or f"{team}@OPP",
+                injury[0] if injury else '',
+            ))
     
     print(f"✅ Converted Yahoo CSV to FanDuel single game format: {fanduel_csv_path}")
 
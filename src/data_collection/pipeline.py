@@ -11,9 +11,14 @@ This script orchestrates the entire process:
 """
 
 import asyncio
+import atexit
 import csv
 import logging
+import logging.handlers
+import queue
+import random
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
@@ -27,6 +32,93 @@ from . import (
 )
 from .lineup_optimizer import create_yahoo_players_csv
 
+# Maximum number of contests whose lineups are generated concurrently
+MAX_CONCURRENT_CONTESTS = 8
+
+# Expanded sample players for testing
+_NFL_SAMPLE_PLAYERS = (
+    # QBs
+    {"name": "Patrick Mahomes", "position": "QB", "team": "KC", "salary": 35, "projection": 25.5},
+    {"name": "Josh Allen", "position": "QB", "team": "BUF", "salary": 34, "projection": 24.8},
+    {"name": "Lamar Jackson", "position": "QB", "team": "BAL", "salary": 33, "projection": 23.9},
+    {"name": "Jalen Hurts", "position": "QB", "team": "PHI", "salary": 32, "projection": 22.7},
+    {"name": "Dak Prescott", "position": "QB", "team": "DAL", "salary": 31, "projection": 21.5},
+    {"name": "Justin Herbert", "position": "QB", "team": "LAC", "salary": 30, "projection": 20.8},
+    {"name": "Joe Burrow", "position": "QB", "team": "CIN", "salary": 29, "projection": 19.9},
+    {"name": "Trevor Lawrence", "position": "QB", "team": "JAX", "salary": 28, "projection": 18.7},
+    {"name": "Tua Tagovailoa", "position": "QB", "team": "MIA", "salary": 27, "projection": 17.8},
+    {"name": "Kirk Cousins", "position": "QB", "team": "MIN", "salary": 26, "projection": 16.9},
+
+    # RBs
+    {"name": "Christian McCaffrey", "position": "RB", "team": "SF", "salary": 38, "projection": 28.2},
+    {"name": "Saquon Barkley", "position": "RB", "team": "PHI", "salary": 37, "projection": 27.5},
+    {"name": "Derrick Henry", "position": "RB", "team": "BAL", "salary": 36, "projection": 26.8},
+    {"name": "Nick Chubb", "position": "RB", "team": "CLE", "salary": 35, "projection": 25.9},
+    {"name": "Alvin Kamara", "position": "RB", "team": "NO", "salary": 34, "projection": 24.7},
+    {"name": "Austin Ekeler", "position": "RB", "team": "LAC", "salary": 33, "projection": 23.8},
+    {"name": "Joe Mixon", "position": "RB", "team": "CIN", "salary": 32, "projection": 22.9},
+    {"name": "Miles Sanders", "position": "RB", "team": "CAR", "salary": 31, "projection": 21.7},
+    {"name": "Jahmyr Gibbs", "position": "RB", "team": "DET", "salary": 30, "projection": 20.8},
+    {"name": "Breece Hall", "position": "RB", "team": "NYJ", "salary": 29, "projection": 19.9},
+
+    # WRs
+    {"name": "Tyreek Hill", "position": "WR", "team": "MIA", "salary": 32, "projection": 24.8},
+    {"name": "CeeDee Lamb", "position": "WR", "team": "DAL", "salary": 31, "projection": 23.9},
+    {"name": "Justin Jefferson", "position": "WR", "team": "MIN", "salary": 30, "projection": 22.8},
+    {"name": "Amon-Ra St. Brown", "position": "WR", "team": "DET", "salary": 29, "projection": 21.7},
+    {"name": "Stefon Diggs", "position": "WR", "team": "HOU", "salary": 28, "projection": 20.8},
+    {"name": "Davante Adams", "position": "WR", "team": "LV", "salary": 27, "projection": 19.9},
+    {"name": "Cooper Kupp", "position": "WR", "team": "LAR", "salary": 26, "projection": 18.7},
+    {"name": "Deebo Samuel", "position": "WR", "team": "SF", "salary": 25, "projection": 17.8},
+    {"name": "Brandon Aiyuk", "position": "WR", "team": "SF", "salary": 24, "projection": 16.9},
+    {"name": "Tee Higgins", "position": "WR", "team": "CIN", "salary": 23, "projection": 15.8},
+
+    # TEs
+    {"name": "Travis Kelce", "position": "TE", "team": "KC", "salary": 28, "projection": 22.1},
+    {"name": "Mark Andrews", "position": "TE", "team": "BAL", "salary": 27, "projection": 21.2},
+    {"name": "T.J. Hockenson", "position": "TE", "team": "MIN", "salary": 26, "projection": 20.3},
+    {"name": "George Kittle", "position": "TE", "team": "SF", "salary": 25, "projection": 19.4},
+    {"name": "Sam LaPorta", "position": "TE", "team": "DET", "salary": 24, "projection": 18.5},
+    {"name": "Evan Engram", "position": "TE", "team": "JAX", "salary": 23, "projection": 17.6},
+    {"name": "Jake Ferguson", "position": "TE", "team": "DAL", "salary": 22, "projection": 16.7},
+    {"name": "Taysom Hill", "position": "TE", "team": "NO", "salary": 21, "projection": 15.8},
+    {"name": "Cole Kmet", "position": "TE", "team": "CHI", "salary": 20, "projection": 14.9},
+    {"name": "Pat Freiermuth", "position": "TE", "team": "PIT", "salary": 19, "projection": 13.8},
+
+    # Ks
+    {"name": "Justin Tucker", "position": "K", "team": "BAL", "salary": 15, "projection": 9.5},
+    {"name": "Harrison Butker", "position": "K", "team": "KC", "salary": 14, "projection": 8.8},
+    {"name": "Evan McPherson", "position": "K", "team": "CIN", "salary": 13, "projection": 8.1},
+    {"name": "Younghoe Koo", "position": "K", "team": "ATL", "salary": 12, "projection": 7.4},
+    {"name": "Daniel Carlson", "position": "K", "team": "LV", "salary": 11, "projection": 6.7},
+    {"name": "Greg Zuerlein", "position": "K", "team": "NYJ", "salary": 10, "projection": 6.0},
+    {"name": "Matt Gay", "position": "K", "team": "IND", "salary": 9, "projection": 5.3},
+    {"name": "Brandon McManus", "position": "K", "team": "JAX", "salary": 8, "projection": 4.6},
+    {"name": "Cameron Dicker", "position": "K", "team": "LAC", "salary": 7, "projection": 3.9},
+    {"name": "Jake Elliott", "position": "K", "team": "PHI", "salary": 6, "projection": 3.2},
+
+    # DEFs
+    {"name": "San Francisco 49ers", "position": "DEF", "team": "SF", "salary": 18, "projection": 12.3},
+    {"name": "Dallas Cowboys", "position": "DEF", "team": "DAL", "salary": 17, "projection": 11.6},
+    {"name": "Buffalo Bills", "position": "DEF", "team": "BUF", "salary": 16, "projection": 10.9},
+    {"name": "Baltimore Ravens", "position": "DEF", "team": "BAL", "salary": 15, "projection": 10.2},
+    {"name": "New England Patriots", "position": "DEF", "team": "NE", "salary": 14, "projection": 9.5},
+    {"name": "Philadelphia Eagles", "position": "DEF", "team": "PHI", "salary": 13, "projection": 8.8},
+    {"name": "Miami Dolphins", "position": "DEF", "team": "MIA", "salary": 12, "projection": 8.1},
+    {"name": "New York Jets", "position": "DEF", "team": "NYJ", "salary": 11, "projection": 7.4},
+    {"name": "Cleveland Browns", "position": "DEF", "team": "CLE", "salary": 10, "projection": 6.7},
+    {"name": "Denver Broncos", "position": "DEF", "team": "DEN", "salary": 9, "projection": 6.0},
+)
+
+# Sample NBA players for testing
+_NBA_SAMPLE_PLAYERS = (
+    {"name": "Nikola Jokic", "position": "C", "team": "DEN", "salary": 42, "projection": 55.2},
+    {"name": "Luka Doncic", "position": "PG", "team": "DAL", "salary": 40, "projection": 52.8},
+    {"name": "Joel Embiid", "position": "C", "team": "PHI", "salary": 38, "projection": 48.5},
+    {"name": "Giannis Antetokounmpo", "position": "PF", "team": "MIL", "salary": 39, "projection": 51.2},
+    {"name": "Stephen Curry", "position": "PG", "team": "GSW", "salary": 36, "projection": 45.8},
+)
+
 
 class DFSPipeline:
     """Main pipeline for DFS data collection and lineup optimization."""
@@ -57,15 +149,27 @@ class DFSPipeline:
         self._setup_logging()
         
     def _setup_logging(self):
-        """Setup logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
+        """
+        Setup logging configuration.
+        
+        Log calls only enqueue records; a background listener thread writes
+        them to the log file and console, keeping file I/O off the event loop.
+        """
+        if not logging.getLogger().handlers:
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(
+                log_queue,
                 logging.FileHandler(self.output_dir / "pipeline.log"),
                 logging.StreamHandler()
-            ]
-        )
+            )
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                handlers=[logging.handlers.QueueHandler(log_queue)]
+            )
+            listener.start()
+            # Flush queued records before the interpreter exits
+            atexit.register(listener.stop)
         self.logger = logging.getLogger(__name__)
     
     async def collect_contests(self, sport: SportType, max_entry_fee: float = 1.0) -> List[Dict[str, Any]]:
@@ -119,160 +223,75 @@ class DFSPipeline:
         """
         self.logger.info(f"Collecting projections for {sport.value}")
         
-        all_projections = {}
-        
-        for source_name, collector in self.collectors.items():
-            try:
-                self.logger.info(f"Collecting from {source_name}...")
-                
-                # Placeholder: In off-season, return empty projections
-                # TODO: Implement actual projection collection when collectors are ready
-                if sport == SportType.NFL:
-                    projections = self._get_placeholder_nfl_projections(source_name)
-                elif sport == SportType.NBA:
-                    projections = self._get_placeholder_nba_projections(source_name)
-                else:
-                    projections = []
-                
-                all_projections[source_name] = projections
-                self.logger.info(f"Collected {len(projections)} projections from {source_name}")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to collect from {source_name}: {e}")
-                all_projections[source_name] = []
+        # Sources are independent, so fetch them concurrently
+        results = await asyncio.gather(
+            *(
+                self._collect_one(source_name, collector, sport)
+                for source_name, collector in self.collectors.items()
+            )
+        )
+        return dict(results)
+    
+    async def _collect_one(self, source_name: str, collector: Any,
+                           sport: SportType) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Collect projections from a single source.
         
-        return all_projections
+        Args:
+            source_name: Name of the projection source
+            collector: Collector for the source
+            sport: Sport type to collect projections for
+            
+        Returns:
+            Tuple of (source name, projections); projections are empty on failure
+        """
+        try:
+            self.logger.info(f"Collecting from {source_name}...")
+            
+            # Placeholder: In off-season, return empty projections
+            # TODO: Implement actual projection collection when collectors are ready
+            if sport == SportType.NFL:
+                projections = self._get_placeholder_nfl_projections(source_name)
+            elif sport == SportType.NBA:
+                projections = self._get_placeholder_nba_projections(source_name)
+            else:
+                projections = []
+            
+            self.logger.info(f"Collected {len(projections)} projections from {source_name}")
+            return source_name, projections
+            
+        except Exception as e:
+            self.logger.error(f"Failed to collect from {source_name}: {e}")
+            return source_name, []
     
     def _get_placeholder_nfl_projections(self, source: str) -> List[Dict[str, Any]]:
         """Generate placeholder NFL projections for testing."""
-        # Expanded sample players for testing
-        sample_players = [
-            # QBs
-            {"name": "Patrick Mahomes", "position": "QB", "team": "KC", "salary": 35, "projection": 25.5},
-            {"name": "Josh Allen", "position": "QB", "team": "BUF", "salary": 34, "projection": 24.8},
-            {"name": "Lamar Jackson", "position": "QB", "team": "BAL", "salary": 33, "projection": 23.9},
-            {"name": "Jalen Hurts", "position": "QB", "team": "PHI", "salary": 32, "projection": 22.7},
-            {"name": "Dak Prescott", "position": "QB", "team": "DAL", "salary": 31, "projection": 21.5},
-            {"name": "Justin Herbert", "position": "QB", "team": "LAC", "salary": 30, "projection": 20.8},
-            {"name": "Joe Burrow", "position": "QB", "team": "CIN", "salary": 29, "projection": 19.9},
-            {"name": "Trevor Lawrence", "position": "QB", "team": "JAX", "salary": 28, "projection": 18.7},
-            {"name": "Tua Tagovailoa", "position": "QB", "team": "MIA", "salary": 27, "projection": 17.8},
-            {"name": "Kirk Cousins", "position": "QB", "team": "MIN", "salary": 26, "projection": 16.9},
-            
-            # RBs
-            {"name": "Christian McCaffrey", "position": "RB", "team": "SF", "salary": 38, "projection": 28.2},
-            {"name": "Saquon Barkley", "position": "RB", "team": "PHI", "salary": 37, "projection": 27.5},
-            {"name": "Derrick Henry", "position": "RB", "team": "BAL", "salary": 36, "projection": 26.8},
-            {"name": "Nick Chubb", "position": "RB", "team": "CLE", "salary": 35, "projection": 25.9},
-            {"name": "Alvin Kamara", "position": "RB", "team": "NO", "salary": 34, "projection": 24.7},
-            {"name": "Austin Ekeler", "position": "RB", "team": "LAC", "salary": 33, "projection": 23.8},
-            {"name": "Joe Mixon", "position": "RB", "team": "CIN", "salary": 32, "projection": 22.9},
-            {"name": "Miles Sanders", "position": "RB", "team": "CAR", "salary": 31, "projection": 21.7},
-            {"name": "Jahmyr Gibbs", "position": "RB", "team": "DET", "salary": 30, "projection": 20.8},
-            {"name": "Breece Hall", "position": "RB", "team": "NYJ", "salary": 29, "projection": 19.9},
-            
-            # WRs
-            {"name": "Tyreek Hill", "position": "WR", "team": "MIA", "salary": 32, "projection": 24.8},
-            {"name": "CeeDee Lamb", "position": "WR", "team": "DAL", "salary": 31, "projection": 23.9},
-            {"name": "Justin Jefferson", "position": "WR", "team": "MIN", "salary": 30, "projection": 22.8},
-            {"name": "Amon-Ra St. Brown", "position": "WR", "team": "DET", "salary": 29, "projection": 21.7},
-            {"name": "Stefon Diggs", "position": "WR", "team": "HOU", "salary": 28, "projection": 20.8},
-            {"name": "Davante Adams", "position": "WR", "team": "LV", "salary": 27, "projection": 19.9},
-            {"name": "Cooper Kupp", "position": "WR", "team": "LAR", "salary": 26, "projection": 18.7},
-            {"name": "Deebo Samuel", "position": "WR", "team": "SF", "salary": 25, "projection": 17.8},
-            {"name": "Brandon Aiyuk", "position": "WR", "team": "SF", "salary": 24, "projection": 16.9},
-            {"name": "Tee Higgins", "position": "WR", "team": "CIN", "salary": 23, "projection": 15.8},
-            
-            # TEs
-            {"name": "Travis Kelce", "position": "TE", "team": "KC", "salary": 28, "projection": 22.1},
-            {"name": "Mark Andrews", "position": "TE", "team": "BAL", "salary": 27, "projection": 21.2},
-            {"name": "T.J. Hockenson", "position": "TE", "team": "MIN", "salary": 26, "projection": 20.3},
-            {"name": "George Kittle", "position": "TE", "team": "SF", "salary": 25, "projection": 19.4},
-            {"name": "Sam LaPorta", "position": "TE", "team": "DET", "salary": 24, "projection": 18.5},
-            {"name": "Evan Engram", "position": "TE", "team": "JAX", "salary": 23, "projection": 17.6},
-            {"name": "Jake Ferguson", "position": "TE", "team": "DAL", "salary": 22, "projection": 16.7},
-            {"name": "Taysom Hill", "position": "TE", "team": "NO", "salary": 21, "projection": 15.8},
-            {"name": "Cole Kmet", "position": "TE", "team": "CHI", "salary": 20, "projection": 14.9},
-            {"name": "Pat Freiermuth", "position": "TE", "team": "PIT", "salary": 19, "projection": 13.8},
-            
-            # Ks
-            {"name": "Justin Tucker", "position": "K", "team": "BAL", "salary": 15, "projection": 9.5},
-            {"name": "Harrison Butker", "position": "K", "team": "KC", "salary": 14, "projection": 8.8},
-            {"name": "Evan McPherson", "position": "K", "team": "CIN", "salary": 13, "projection": 8.1},
-            {"name": "Younghoe Koo", "position": "K", "team": "ATL", "salary": 12, "projection": 7.4},
-            {"name": "Daniel Carlson", "position": "K", "team": "LV", "salary": 11, "projection": 6.7},
-            {"name": "Greg Zuerlein", "position": "K", "team": "NYJ", "salary": 10, "projection": 6.0},
-            {"name": "Matt Gay", "position": "K", "team": "IND", "salary": 9, "projection": 5.3},
-            {"name": "Brandon McManus", "position": "K", "team": "JAX", "salary": 8, "projection": 4.6},
-            {"name": "Cameron Dicker", "position": "K", "team": "LAC", "salary": 7, "projection": 3.9},
-            {"name": "Jake Elliott", "position": "K", "team": "PHI", "salary": 6, "projection": 3.2},
-            
-            # DEFs
-            {"name": "San Francisco 49ers", "position": "DEF", "team": "SF", "salary": 18, "projection": 12.3},
-            {"name": "Dallas Cowboys", "position": "DEF", "team": "DAL", "salary": 17, "projection": 11.6},
-            {"name": "Buffalo Bills", "position": "DEF", "team": "BUF", "salary": 16, "projection": 10.9},
-            {"name": "Baltimore Ravens", "position": "DEF", "team": "BAL", "salary": 15, "projection": 10.2},
-            {"name": "New England Patriots", "position": "DEF", "team": "NE", "salary": 14, "projection": 9.5},
-            {"name": "Philadelphia Eagles", "position": "DEF", "team": "PHI", "salary": 13, "projection": 8.8},
-            {"name": "Miami Dolphins", "position": "DEF", "team": "MIA", "salary": 12, "projection": 8.1},
-            {"name": "New York Jets", "position": "DEF", "team": "NYJ", "salary": 11, "projection": 7.4},
-            {"name": "Cleveland Browns", "position": "DEF", "team": "CLE", "salary": 10, "projection": 6.7},
-            {"name": "Denver Broncos", "position": "DEF", "team": "DEN", "salary": 9, "projection": 6.0},
-        ]
-        
-        projections = []
-        for player in sample_players:
-            # Add some variation based on source
-            import random
-            variation = random.uniform(0.9, 1.1)
-            adjusted_projection = player["projection"] * variation
-            
-            projections.append({
-                "player_name": player["name"],
-                "source": source,
-                "projection": round(adjusted_projection, 1),
-                "confidence": round(random.uniform(0.7, 0.95), 2),
-                "position": player["position"],
-                "salary": player["salary"],
-                "fppg": player["projection"],
-                "team": player["team"],
-                "opponent": "TBD",
-                "game_time": "TBD",
-            })
-        
-        return projections
+        return self._placeholder_projections(_NFL_SAMPLE_PLAYERS, source)
     
     def _get_placeholder_nba_projections(self, source: str) -> List[Dict[str, Any]]:
         """Generate placeholder NBA projections for testing."""
-        # Sample NBA players for testing
-        sample_players = [
-            {"name": "Nikola Jokic", "position": "C", "team": "DEN", "salary": 42, "projection": 55.2},
-            {"name": "Luka Doncic", "position": "PG", "team": "DAL", "salary": 40, "projection": 52.8},
-            {"name": "Joel Embiid", "position": "C", "team": "PHI", "salary": 38, "projection": 48.5},
-            {"name": "Giannis Antetokounmpo", "position": "PF", "team": "MIL", "salary": 39, "projection": 51.2},
-            {"name": "Stephen Curry", "position": "PG", "team": "GSW", "salary": 36, "projection": 45.8},
-        ]
-        
-        projections = []
-        for player in sample_players:
-            import random
-            variation = random.uniform(0.9, 1.1)
-            adjusted_projection = player["projection"] * variation
-            
-            projections.append({
-                "player_name": player["name"],  # This should match what the pipeline expects
+        return self._placeholder_projections(_NBA_SAMPLE_PLAYERS, source)
+    
+    @staticmethod
+    def _placeholder_projections(sample_players: Tuple[Dict[str, Any], ...],
+                                 source: str) -> List[Dict[str, Any]]:
+        """Build projections from sample players, with some variation based on source."""
+        uniform = random.uniform
+        return [
+            {
+                "player_name": player["name"],
                 "source": source,
-                "projection": round(adjusted_projection, 1),
-                "confidence": round(random.uniform(0.7, 0.95), 2),
+                "projection": round(player["projection"] * uniform(0.9, 1.1), 1),
+                "confidence": round(uniform(0.7, 0.95), 2),
                 "position": player["position"],
                 "salary": player["salary"],
                 "fppg": player["projection"],
                 "team": player["team"],
                 "opponent": "TBD",
                 "game_time": "TBD",
-            })
-        
-        return projections
+            }
+            for player in sample_players
+        ]
     
     async def standardize_projections(self, all_projections: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
         """
@@ -316,17 +335,16 @@ class DFSPipeline:
         try:
             # Create temporary CSV for the optimizer
             temp_csv = self.output_dir / f"temp_contest_{getattr(contest, 'contest_id', 'unknown')}.csv"
-            
-            # Create Yahoo-compatible CSV
-            create_yahoo_players_csv(projections, str(temp_csv), use_consensus=True)
+            await self._write_players_csv(projections, temp_csv)
             
             # TODO: Integrate with actual lineup optimizer
             # For now, return placeholder lineups
             lineups = self._generate_placeholder_lineups(contest, projections, num_lineups)
             
             # Clean up temp file
-            if temp_csv.exists():
-                temp_csv.unlink()
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(temp_csv.unlink, missing_ok=True)
+            )
             
             return lineups
             
@@ -334,18 +352,31 @@ class DFSPipeline:
             self.logger.error(f"Failed to generate lineups for contest: {e}")
             return []
     
+    async def _write_players_csv(self, projections: List[Dict[str, Any]], path: Path) -> str:
+        """
+        Write the Yahoo-compatible players CSV off the event loop.
+        
+        Args:
+            projections: Player projections
+            path: Where to write the CSV
+            
+        Returns:
+            Path to the written CSV
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            None, create_yahoo_players_csv, projections, str(path), True
+        )
+        return str(path)
+    
     def _generate_placeholder_lineups(self, contest: Any, projections: List[Dict[str, Any]], 
                                     num_lineups: int) -> List[Dict[str, Any]]:
         """Generate placeholder lineups for testing."""
         lineups = []
         
-        # Group projections by player
-        player_projections = {}
+        # Index projections by position once, keeping their original order
+        by_position: Dict[str, List[Dict[str, Any]]] = {}
         for proj in projections:
-            player_name = proj["player_name"]
-            if player_name not in player_projections:
-                player_projections[player_name] = []
-            player_projections[player_name].append(proj)
+            by_position.setdefault(proj["position"], []).append(proj)
         
         # Generate lineups
         for i in range(num_lineups):
@@ -362,17 +393,19 @@ class DFSPipeline:
             # Simple lineup construction (QB, RB, WR, TE, K, DEF for NFL)
             positions_needed = ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "K", "DEF"]
             used_players = set()
+            # Next candidate index in each position bucket; earlier ones are used
+            cursors = dict.fromkeys(by_position, 0)
             
             for pos in positions_needed:
-                # Find available players for this position
-                available = [
-                    p for p in projections 
-                    if p["position"] == pos and p["player_name"] not in used_players
-                ]
+                # Pick first available player for this position
+                bucket = by_position.get(pos, ())
+                cursor = cursors.get(pos, 0)
+                while cursor < len(bucket) and bucket[cursor]["player_name"] in used_players:
+                    cursor += 1
                 
-                if available:
-                    # Pick first available player
-                    player = available[0]
+                if cursor < len(bucket):
+                    player = bucket[cursor]
+                    cursors[pos] = cursor + 1
                     lineup["players"].append({
                         "position": pos,
                         "player_name": player["player_name"],  # Changed from "name" to "player_name"
@@ -406,7 +439,10 @@ class DFSPipeline:
         # Create filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         contest_name = getattr(contest, "contest_name", "unknown").replace(" ", "_").replace("$", "").replace(",", "")
-        filename = f"lineups_{contest_name}_{timestamp}.csv"
+        # Contests are saved concurrently and Yahoo reuses contest names, so
+        # include the contest ID to keep each contest's file distinct
+        contest_id = getattr(contest, "contest_id", "unknown")
+        filename = f"lineups_{contest_name}_{contest_id}_{timestamp}.csv"
         filepath = self.output_dir / filename
         
         # Write lineups to CSV
@@ -417,28 +453,58 @@ class DFSPipeline:
                 "team", "salary", "projection"
             ]
             
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for lineup in lineups:
-                for player in lineup["players"]:
-                    writer.writerow({
-                        "lineup_id": lineup["lineup_id"],
-                        "contest_id": lineup["contest_id"],
-                        "contest_name": lineup["contest_name"],
-                        "entry_fee": lineup["entry_fee"],
-                        "total_salary": lineup["total_salary"],
-                        "projected_points": lineup["projected_points"],
-                        "position": player["position"],
-                        "player_name": player["player_name"],
-                        "team": player["team"],
-                        "salary": player["salary"],
-                        "projection": player["projection"]
-                    })
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            # Rows are generated as they're written; no flattened copy of the lineups
+            writer.writerows(
+                (
+                    lineup["lineup_id"],
+                    lineup["contest_id"],
+                    lineup["contest_name"],
+                    lineup["entry_fee"],
+                    lineup["total_salary"],
+                    lineup["projected_points"],
+                    player["position"],
+                    player["player_name"],
+                    player["team"],
+                    player["salary"],
+                    player["projection"],
+                )
+                for lineup in lineups
+                for player in lineup["players"]
+            )
         
         self.logger.info(f"Saved {len(lineups)} lineups to {filepath}")
         return str(filepath)
     
+    async def _process_contest(self, contest: Any, projections: List[Dict[str, Any]],
+                               semaphore: asyncio.Semaphore) -> Tuple[str, int]:
+        """
+        Generate and save lineups for one contest.
+        
+        Args:
+            contest: Contest information (YahooContest object)
+            projections: Standardized player projections
+            semaphore: Limits how many contests are processed at once
+            
+        Returns:
+            Tuple of (saved CSV path or "", number of lineups generated)
+        """
+        async with semaphore:
+            num_lineups = contest.max_entries_per_user
+            lineups = await self.generate_lineups_for_contest(
+                contest, projections, num_lineups
+            )
+            
+            if not lineups:
+                return "", 0
+            
+            # Save lineups to CSV
+            csv_file = await asyncio.get_running_loop().run_in_executor(
+                None, self.save_lineups_to_csv, lineups, contest
+            )
+            return csv_file, len(lineups)
+    
     async def run_pipeline(self, sport: SportType, max_entry_fee: float = 1.0) -> Dict[str, Any]:
         """
         Run the complete DFS pipeline.
@@ -461,39 +527,52 @@ class DFSPipeline:
         }
         
         try:
+            # Step 2 doesn't depend on step 1, so collect projections from all
+            # sources in the background while contests are being collected
+            projections_task = asyncio.create_task(self.collect_projections(sport))
+            
             # Step 1: Collect qualifying contests
-            contests = await self.collect_contests(sport, max_entry_fee)
+            try:
+                contests = await self.collect_contests(sport, max_entry_fee)
+            except BaseException:
+                projections_task.cancel()
+                raise
             if not contests:
+                projections_task.cancel()
                 self.logger.warning("No qualifying contests found")
                 return results
             
             # Step 2: Collect projections from all sources
-            all_projections = await self.collect_projections(sport)
+            all_projections = await projections_task
             
             # Step 3: Standardize projections
             standardized_projections = await self.standardize_projections(all_projections)
             
-            # Step 4: Generate lineups for each contest
-            for contest in contests:
-                try:
-                    num_lineups = contest.max_entries_per_user
-                    lineups = await self.generate_lineups_for_contest(
-                        contest, standardized_projections, num_lineups
-                    )
-                    
-                    if lineups:
-                        # Save lineups to CSV
-                        csv_file = self.save_lineups_to_csv(lineups, contest)
-                        if csv_file:
-                            results["files_created"].append(csv_file)
-                            results["total_lineups_generated"] += len(lineups)
-                    
-                    results["contests_processed"] += 1
-                    
-                except Exception as e:
-                    error_msg = f"Failed to process contest {getattr(contest, 'contest_id', 'unknown')}: {e}"
+            # Step 4: Generate lineups for each contest; contests are
+            # independent, so process several at once
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONTESTS)
+            per_contest = await asyncio.gather(
+                *(
+                    self._process_contest(contest, standardized_projections, semaphore)
+                    for contest in contests
+                ),
+                return_exceptions=True,
+            )
+            
+            for contest, outcome in zip(contests, per_contest):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+                if isinstance(outcome, BaseException):
+                    error_msg = f"Failed to process contest {getattr(contest, 'contest_id', 'unknown')}: {outcome}"
                     self.logger.error(error_msg)
                     results["errors"].append(error_msg)
+                    continue
+                
+                csv_file, num_generated = outcome
+                if csv_file:
+                    results["files_created"].append(csv_file)
+                    results["total_lineups_generated"] += num_generated
+                results["contests_processed"] += 1
             
             self.logger.info(f"Pipeline completed successfully!")
             self.logger.info(f"Processed {results['contests_processed']} contests")
@@ -6,8 +6,93 @@ across different projection sources using Yahoo DFS as the reference.
 """
 
 import re
+from heapq import merge
 from difflib import SequenceMatcher
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_DOT_RE = re.compile(r'\.')
+_SUFFIX_RE = re.compile(r'\s+(jr\.?|sr\.?|ii|iii|iv)$')
+
+
+@lru_cache(maxsize=4096)
+def _standardize_name(name: str) -> str:
+    """Standardize a player name (cached per distinct name)."""
+    if not name:
+        return ""
+    
+    # Remove extra spaces, convert to lowercase for matching
+    return _WHITESPACE_RE.sub(' ', name.strip()).lower()
+
+
+def _ratio_upper_bound(len_a: int, len_b: int) -> float:
+    """Upper bound on SequenceMatcher.ratio() from string lengths alone.
+
+    Same value as SequenceMatcher.real_quick_ratio(), without building a
+    matcher.
+    """
+    total = len_a + len_b
+    return 2.0 * min(len_a, len_b) / total if total else 1.0
+
+
+def _names_equivalent(yahoo_std: str, proj_std: str) -> bool:
+    """Check standardized names for exact matches and common variations."""
+    # Exact match after standardization
+    if yahoo_std == proj_std:
+        return True
+    
+    # Handle common variations
+    # 1. Initials vs full names (e.g., "A.J. Brown" vs "AJ Brown")
+    yahoo_clean = _DOT_RE.sub('', yahoo_std)
+    proj_clean = _DOT_RE.sub('', proj_std)
+    if yahoo_clean == proj_clean:
+        return True
+    
+    # 2. Handle Jr., Sr., III, etc.
+    yahoo_no_suffix = _SUFFIX_RE.sub('', yahoo_std)
+    proj_no_suffix = _SUFFIX_RE.sub('', proj_std)
+    return yahoo_no_suffix == proj_no_suffix
+
+
+@lru_cache(maxsize=65536)
+def _fuzzy_match_cached(yahoo_std: str, proj_std: str, threshold: float) -> bool:
+    """Fuzzy match two standardized names (cached per name pair and threshold)."""
+    if _names_equivalent(yahoo_std, proj_std):
+        return True
+    
+    # 3. Fuzzy matching for typos/variations, skipped when the lengths
+    # alone rule out reaching the threshold
+    if _ratio_upper_bound(len(yahoo_std), len(proj_std)) < threshold:
+        return False
+    matcher = SequenceMatcher(None, yahoo_std, proj_std)
+    return matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold
+
+
+def _name_initials(name_std: str) -> Tuple[str, str]:
+    """(first initial, last initial) of a standardized name, ignoring dots and suffixes."""
+    tokens = _DOT_RE.sub('', _SUFFIX_RE.sub('', name_std)).split()
+    if not tokens:
+        return ('', '')
+    return (tokens[0][0], tokens[-1][0])
+
+
+def _build_index(
+    candidates: List[Tuple[str, str]]
+) -> Tuple[Dict[str, List[int]], Dict[str, List[int]]]:
+    """Index (candidate, standardized name) pairs by first and last initial.
+    
+    Returns:
+        Two dicts mapping an initial to the ascending positions of the
+        candidates with that first / last initial
+    """
+    by_first: Dict[str, List[int]] = {}
+    by_last: Dict[str, List[int]] = {}
+    for position, (_, candidate_std) in enumerate(candidates):
+        first, last = _name_initials(candidate_std)
+        by_first.setdefault(first, []).append(position)
+        by_last.setdefault(last, []).append(position)
+    return by_first, by_last
 
 
 class PlayerNameMatcher:
@@ -15,14 +100,21 @@ class PlayerNameMatcher:
     
     def __init__(self):
         self.yahoo_players_cache: Dict[str, Dict[str, Any]] = {}
+        # Last candidate list passed to find_best_match and its standardized
+        # (name, standardized name) pairs, reused while callers pass the same names
+        self._candidate_cache: Optional[
+            Tuple[Tuple[str, ...], List[Tuple[str, str]]]
+        ] = None
+        # Standardized name -> first candidate with that name, for the cached list
+        self._candidate_exact: Dict[str, str] = {}
+        # Initials index over the cached candidates, built on first blocked lookup
+        self._candidate_index: Optional[
+            Tuple[Dict[str, List[int]], Dict[str, List[int]]]
+        ] = None
     
     def standardize_name(self, name: str) -> str:
         """Standardize player name format for consistent matching."""
-        if not name:
-            return ""
-        
-        # Remove extra spaces, convert to lowercase for matching
-        return re.sub(r'\s+', ' ', name.strip()).lower()
+        return _standardize_name(name)
     
     def fuzzy_match(self, yahoo_name: str, projection_name: str, threshold: float = 0.8) -> bool:
         """
@@ -39,31 +131,19 @@ class PlayerNameMatcher:
         if not yahoo_name or not projection_name:
             return False
             
-        yahoo_std = self.standardize_name(yahoo_name)
-        proj_std = self.standardize_name(projection_name)
-        
-        # Exact match after standardization
-        if yahoo_std == proj_std:
-            return True
-        
-        # Handle common variations
-        # 1. Initials vs full names (e.g., "A.J. Brown" vs "AJ Brown")
-        yahoo_clean = re.sub(r'\.', '', yahoo_std)
-        proj_clean = re.sub(r'\.', '', proj_std)
-        if yahoo_clean == proj_clean:
-            return True
-        
-        # 2. Handle Jr., Sr., III, etc.
-        yahoo_no_suffix = re.sub(r'\s+(jr\.?|sr\.?|ii|iii|iv)$', '', yahoo_std)
-        proj_no_suffix = re.sub(r'\s+(jr\.?|sr\.?|ii|iii|iv)$', '', proj_std)
-        if yahoo_no_suffix == proj_no_suffix:
-            return True
-        
-        # 3. Fuzzy matching for typos/variations
-        similarity = SequenceMatcher(None, yahoo_std, proj_std).ratio()
-        return similarity >= threshold
+        return _fuzzy_match_cached(
+            self.standardize_name(yahoo_name),
+            self.standardize_name(projection_name),
+            threshold,
+        )
     
-    def find_best_match(self, yahoo_name: str, candidate_names: List[str], threshold: float = 0.8) -> Optional[str]:
+    def find_best_match(
+        self,
+        yahoo_name: str,
+        candidate_names: List[str],
+        threshold: float = 0.8,
+        blocking: bool = False,
+    ) -> Optional[str]:
         """
         Find the best matching name from a list of candidates.
         
@@ -71,27 +151,103 @@ class PlayerNameMatcher:
             yahoo_name: Reference name from Yahoo
             candidate_names: List of names to match against
             threshold: Minimum similarity threshold
+            blocking: Only compare candidates sharing the Yahoo name's first or
+                last initial. Much faster on large candidate lists, but misses
+                names misspelled in both initials
             
         Returns:
             Best matching name or None if no match above threshold
         """
-        if not candidate_names:
+        if not yahoo_name or not candidate_names:
             return None
-            
+        
+        yahoo_std = self.standardize_name(yahoo_name)
+        candidates = self._standardized_candidates(candidate_names)
+        
+        # An exact match after standardization scores 1.0, which no other
+        # candidate can beat, so skip the fuzzy pass entirely
+        exact = self._candidate_exact.get(yahoo_std)
+        if exact is not None:
+            return exact
+        
+        # One matcher for the Yahoo name; each candidate's similarity is
+        # computed once and used both to accept it and to rank it
+        matcher = SequenceMatcher(None, yahoo_std)
+        yahoo_len = len(yahoo_std)
         best_match = None
         best_score = 0.0
         
-        for candidate in candidate_names:
-            if self.fuzzy_match(yahoo_name, candidate, threshold):
-                score = SequenceMatcher(None, 
-                                      self.standardize_name(yahoo_name),
-                                      self.standardize_name(candidate)).ratio()
-                if score > best_score:
-                    best_score = score
-                    best_match = candidate
+        if blocking:
+            candidates = self._block_candidates(candidates, yahoo_std)
+        
+        for candidate, candidate_std in candidates:
+            # Cheap upper bounds on the ratio (lengths, then character counts)
+            # skip candidates that can't beat the best so far, or that can't
+            # reach the threshold and don't match by the naming rules
+            equivalent = None
+            upper = _ratio_upper_bound(yahoo_len, len(candidate_std))
+            if upper <= best_score:
+                continue
+            if upper < threshold:
+                equivalent = _names_equivalent(yahoo_std, candidate_std)
+                if not equivalent:
+                    continue
+            
+            matcher.set_seq2(candidate_std)
+            upper = matcher.quick_ratio()
+            if upper <= best_score:
+                continue
+            if upper < threshold and equivalent is None:
+                equivalent = _names_equivalent(yahoo_std, candidate_std)
+                if not equivalent:
+                    continue
+            
+            score = matcher.ratio()
+            if score > best_score and (
+                score >= threshold
+                or equivalent
+                or _names_equivalent(yahoo_std, candidate_std)
+            ):
+                best_score = score
+                best_match = candidate
         
         return best_match
     
+    def _standardized_candidates(self, candidate_names: List[str]) -> List[Tuple[str, str]]:
+        """Pair each non-empty candidate with its standardized name (memoized)."""
+        key = tuple(candidate_names)
+        cached = self._candidate_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        standardize = self.standardize_name
+        pairs = [
+            (candidate, standardize(candidate)) for candidate in key if candidate
+        ]
+        self._candidate_cache = (key, pairs)
+        self._candidate_index = None
+        self._candidate_exact = {}
+        for candidate, candidate_std in pairs:
+            self._candidate_exact.setdefault(candidate_std, candidate)
+        return pairs
+    
+    def _block_candidates(
+        self, candidates: List[Tuple[str, str]], yahoo_std: str
+    ) -> List[Tuple[str, str]]:
+        """Candidates sharing the first or last initial of yahoo_std, in original order."""
+        if self._candidate_index is None:
+            self._candidate_index = _build_index(candidates)
+        by_first, by_last = self._candidate_index
+        
+        first, last = _name_initials(yahoo_std)
+        blocked = []
+        previous = -1
+        for position in merge(by_first.get(first, ()), by_last.get(last, ())):
+            if position != previous:
+                blocked.append(candidates[position])
+                previous = position
+        return blocked
+    
     def cache_yahoo_players(self, contest_id: str, players: List[Dict[str, Any]]) -> None:
         """Cache Yahoo players for a contest to avoid repeated API calls."""
         self.yahoo_players_cache[contest_id] = {
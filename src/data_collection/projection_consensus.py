@@ -5,10 +5,42 @@ This module provides utilities to determine which projection source to use
 for each player and aggregate projections from multiple sources.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
+from difflib import SequenceMatcher
 from enum import Enum
 
+from .base import DATACLASS_SLOTS
+
+
+# Similarity needed for a projection name to match a Yahoo player name
+_NAME_MATCH_THRESHOLD = 0.8
+
+
+def _bigrams(name: str) -> set:
+    """Set of adjacent character pairs in a name."""
+    return {name[i:i + 2] for i in range(len(name) - 1)}
+
+
+def _needs_shared_bigram(name_length: int, threshold: float) -> bool:
+    """Whether a match at threshold implies sharing a bigram with a name of this length.
+
+    Without a shared bigram every matching block has size 1, and no two
+    matches are adjacent in both names, so 3 * matches <= total_length + 1.
+    The ratio is then at most 2 * (total + 1) / (3 * total), which is
+    largest for the shortest total (the name alone).
+    """
+    return 2 * (name_length + 1) < 3 * name_length * threshold
+
+
+def _ratio_at_least(matcher: SequenceMatcher, threshold: float) -> bool:
+    """Check matcher.ratio() >= threshold, trying its cheap upper bounds first."""
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
+
 
 class ProjectionSource(Enum):
     """Enumeration of available projection sources."""
@@ -19,7 +51,7 @@ class ProjectionSource(Enum):
     NUMBERFIRE = "numberfire"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PlayerProjection:
     """Data structure for player projections from different sources."""
     player_name: str
@@ -53,6 +85,13 @@ class ProjectionConsensus:
         total_weight = sum(self.source_weights.values())
         if total_weight > 0:
             self.source_weights = {k: v/total_weight for k, v in self.source_weights.items()}
+        self._sort_sources()
+    
+    def _sort_sources(self) -> None:
+        """Rank all sources by weight once, whenever the weights change."""
+        self._sorted_sources: List[Tuple[str, float]] = sorted(
+            self.source_weights.items(), key=lambda x: x[1], reverse=True
+        )
     
     def get_best_projection(self, player_projections: Dict[str, float]) -> Tuple[Optional[str], float]:
         """
@@ -64,30 +103,58 @@ class ProjectionConsensus:
         Returns:
             Tuple of (best_source, consensus_projection)
         """
+        best_source, consensus_projection, _, _ = self.analyze_player(
+            player_projections, include_rankings=False
+        )
+        return best_source, consensus_projection
+    
+    def analyze_player(self, player_projections: Dict[str, float], include_rankings: bool = True
+                       ) -> Tuple[Optional[str], float, Optional[List[Tuple[str, float]]], int]:
+        """
+        Compute best source, consensus projection, source rankings and the
+        number of available projections in one pass.
+        
+        The best source is the highest-weighted source with data; on equal
+        weights the first one in player_projections wins. Source rankings
+        order equal weights by the source_weights order instead.
+        
+        Args:
+            player_projections: Dict mapping source names to projection values
+            include_rankings: Whether to build source_rankings (None otherwise)
+            
+        Returns:
+            Tuple of (best_source, consensus_projection, source_rankings, projection_count)
+        """
+        source_rankings = (
+            self.rank_sources_by_quality(player_projections) if include_rankings else None
+        )
         if not player_projections:
-            return None, 0.0
+            return None, 0.0, source_rankings, 0
         
-        # Calculate weighted average
+        # Calculate weighted average, tracking the highest-weighted source
         weighted_sum = 0.0
         total_weight = 0.0
-        available_sources = []
+        projection_count = 0
+        best_source = None
+        best_weight = 0.0
+        source_weights = self.source_weights
         
         for source, projection in player_projections.items():
-            if source in self.source_weights and projection is not None:
-                weight = self.source_weights[source]
+            if projection is None:
+                continue
+            projection_count += 1
+            weight = source_weights.get(source)
+            if weight is not None:
                 weighted_sum += projection * weight
                 total_weight += weight
-                available_sources.append(source)
+                if best_source is None or weight > best_weight:
+                    best_source = source
+                    best_weight = weight
         
         if total_weight == 0:
-            return None, 0.0
-        
-        consensus_projection = weighted_sum / total_weight
+            return None, 0.0, source_rankings, projection_count
         
-        # Return source with highest weight that has data
-        best_source = max(available_sources, key=lambda s: self.source_weights.get(s, 0))
-        
-        return best_source, consensus_projection
+        return best_source, weighted_sum / total_weight, source_rankings, projection_count
     
     def get_consensus_projection(self, player_projections: Dict[str, float]) -> float:
         """
@@ -112,13 +179,11 @@ class ProjectionConsensus:
         Returns:
             List of (source, weight) tuples sorted by weight
         """
-        available_sources = [
-            (source, self.source_weights.get(source, 0))
-            for source in player_projections.keys()
-            if source in self.source_weights and player_projections[source] is not None
+        return [
+            (source, weight)
+            for source, weight in self._sorted_sources
+            if player_projections.get(source) is not None
         ]
-        
-        return sorted(available_sources, key=lambda x: x[1], reverse=True)
     
     def update_source_weight(self, source: str, new_weight: float) -> None:
         """
@@ -134,6 +199,7 @@ class ProjectionConsensus:
             total_weight = sum(self.source_weights.values())
             if total_weight > 0:
                 self.source_weights = {k: v/total_weight for k, v in self.source_weights.items()}
+            self._sort_sources()
     
     def get_source_weights(self) -> Dict[str, float]:
         """Get current source weights."""
@@ -155,6 +221,16 @@ class ProjectionAggregator:
             consensus: ProjectionConsensus instance
         """
         self.consensus = consensus
+        # Normalized Yahoo names for the last yahoo_players dict seen, each with
+        # a matcher that has the name preprocessed as its second sequence
+        self._yahoo_players: Optional[Dict[str, Dict[str, Any]]] = None
+        self._yahoo_candidates: List[Tuple[str, Dict[str, Any], SequenceMatcher]] = []
+        # Normalized Yahoo name -> data of its first entry, for the same dict
+        self._yahoo_exact: Dict[str, Dict[str, Any]] = {}
+        # Bigram -> ascending indices of the Yahoo names containing it
+        self._yahoo_bigram_index: Dict[str, List[int]] = {}
+        # Player name -> formatted name, for the same dict
+        self._format_cache: Dict[str, str] = {}
 
     def aggregate_player_projections(self, all_projections: Dict[str, Dict[str, float]], 
                                    yahoo_players: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
@@ -168,26 +244,38 @@ class ProjectionAggregator:
         Returns:
             Dict mapping player names to aggregated projection data
         """
-        aggregated = {}
+        return dict(self.iter_aggregated(all_projections, yahoo_players))
 
+    def iter_aggregated(self, all_projections: Dict[str, Dict[str, float]],
+                        yahoo_players: Optional[Dict[str, Dict[str, Any]]] = None
+                        ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Lazily aggregate projections, one player at a time.
+
+        Args:
+            all_projections: Dict mapping player names to their projections by source
+            yahoo_players: Optional dict of Yahoo player data for ID formatting
+
+        Yields:
+            (player name, aggregated projection data) in all_projections order
+        """
         for player_name, projections in all_projections.items():
-            best_source, consensus_value = self.consensus.get_best_projection(projections)
-            source_rankings = self.consensus.rank_sources_by_quality(projections)
+            best_source, consensus_value, source_rankings, projection_count = (
+                self.consensus.analyze_player(projections)
+            )
 
             # Format player name with Yahoo ID if available
             formatted_name = self._format_player_name_with_id(player_name, yahoo_players)
 
-            aggregated[player_name] = {
+            yield player_name, {
                 "formatted_name": formatted_name,
                 "consensus_projection": consensus_value,
                 "best_source": best_source,
                 "source_rankings": source_rankings,
                 "all_projections": projections,
-                "projection_count": len([p for p in projections.values() if p is not None])
+                "projection_count": projection_count
             }
 
-        return aggregated
-
     def _format_player_name_with_id(self, player_name: str, 
                                    yahoo_players: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
         """
@@ -205,23 +293,93 @@ class ProjectionAggregator:
         if not yahoo_players:
             return player_name
         
-        # Try to find the player in Yahoo data
-        for yahoo_name, yahoo_data in yahoo_players.items():
-            # Use fuzzy matching to find the player
-            if self._names_match(player_name, yahoo_name):
-                full_yahoo_id = yahoo_data.get('full_yahoo_id')
-                if full_yahoo_id:
-                    return f"{full_yahoo_id} - {player_name.title()}"
-                else:
-                    # Fallback if no full ID
-                    player_id = yahoo_data.get('yahoo_player_id', 'unknown')
-                    game_id = yahoo_data.get('game_id', 'unknown')
-                    return f"{game_id}${player_id} - {player_name.title()}"
+        candidates = self._get_yahoo_candidates(yahoo_players)
+        formatted = self._format_cache.get(player_name)
+        if formatted is None:
+            formatted = self._format_cache[player_name] = self._format_with_candidates(
+                player_name, candidates
+            )
+        return formatted
+
+    def _format_with_candidates(self, player_name: str,
+                                candidates: List[Tuple[str, Dict[str, Any], SequenceMatcher]]) -> str:
+        """Uncached _format_player_name_with_id() over prepared Yahoo candidates."""
+        norm_name = player_name.lower().strip()
+        
+        # Exact name match first, then fuzzy matching to find the player
+        # (same test as _names_match)
+        yahoo_data = self._yahoo_exact.get(norm_name)
+        if yahoo_data is None:
+            if _needs_shared_bigram(len(norm_name), _NAME_MATCH_THRESHOLD):
+                # Only names sharing a bigram can match; keep their original order
+                bigram_index = self._yahoo_bigram_index
+                indices = set()
+                for bigram in _bigrams(norm_name):
+                    indices.update(bigram_index.get(bigram, ()))
+                candidates = [candidates[i] for i in sorted(indices)]
+            yahoo_data = next(
+                (
+                    data for _, data, matcher in candidates
+                    if self._similar(matcher, norm_name, _NAME_MATCH_THRESHOLD)
+                ),
+                None,
+            )
+        
+        if yahoo_data is not None:
+            full_yahoo_id = yahoo_data.get('full_yahoo_id')
+            if full_yahoo_id:
+                return f"{full_yahoo_id} - {player_name.title()}"
+            else:
+                # Fallback if no full ID
+                player_id = yahoo_data.get('yahoo_player_id', 'unknown')
+                game_id = yahoo_data.get('game_id', 'unknown')
+                return f"{game_id}${player_id} - {player_name.title()}"
         
         # If no match found, return original name
         return player_name
 
-    def _names_match(self, name1: str, name2: str, threshold: float = 0.8) -> bool:
+    def _get_yahoo_candidates(
+        self, yahoo_players: Dict[str, Dict[str, Any]]
+    ) -> List[Tuple[str, Dict[str, Any], SequenceMatcher]]:
+        """
+        Normalized Yahoo names with their data and matchers.
+
+        Built once per yahoo_players dict; the dict is assumed unchanged while
+        the same object keeps being passed (call clear_cache() otherwise).
+        """
+        if yahoo_players is not self._yahoo_players:
+            candidates = []
+            exact: Dict[str, Dict[str, Any]] = {}
+            bigram_index: Dict[str, List[int]] = {}
+            for index, (yahoo_name, yahoo_data) in enumerate(yahoo_players.items()):
+                yahoo_norm = yahoo_name.lower().strip()
+                candidates.append((yahoo_norm, yahoo_data, SequenceMatcher(None, "", yahoo_norm)))
+                exact.setdefault(yahoo_norm, yahoo_data)
+                for bigram in _bigrams(yahoo_norm):
+                    bigram_index.setdefault(bigram, []).append(index)
+            self._yahoo_candidates = candidates
+            self._yahoo_exact = exact
+            self._yahoo_bigram_index = bigram_index
+            self._format_cache = {}
+            self._yahoo_players = yahoo_players
+        return self._yahoo_candidates
+
+    @staticmethod
+    def _similar(matcher: SequenceMatcher, norm_name: str,
+                 threshold: float = _NAME_MATCH_THRESHOLD) -> bool:
+        """Check a normalized player name against a matcher's Yahoo name."""
+        matcher.set_seq1(norm_name)
+        return _ratio_at_least(matcher, threshold)
+
+    def clear_cache(self) -> None:
+        """Forget the cached Yahoo player names and formatted names."""
+        self._yahoo_players = None
+        self._yahoo_candidates = []
+        self._yahoo_exact = {}
+        self._yahoo_bigram_index = {}
+        self._format_cache = {}
+
+    def _names_match(self, name1: str, name2: str, threshold: float = _NAME_MATCH_THRESHOLD) -> bool:
         """
         Simple name matching using similarity threshold.
         
@@ -233,8 +391,6 @@ class ProjectionAggregator:
         Returns:
             True if names match above threshold
         """
-        from difflib import SequenceMatcher
-        
         # Normalize names for comparison
         norm1 = name1.lower().strip()
         norm2 = name2.lower().strip()
@@ -243,6 +399,6 @@ class ProjectionAggregator:
         if norm1 == norm2:
             return True
         
-        # Similarity match
-        similarity = SequenceMatcher(None, norm1, norm2).ratio()
-        return similarity >= threshold 
\ No newline at end of file
+        # Similarity match; the cheap upper bounds reject most non-matches
+        # before the full ratio is computed
+        return _ratio_at_least(SequenceMatcher(None, norm1, norm2), threshold) 
\ No newline at end of file